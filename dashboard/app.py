@@ -6,10 +6,12 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 from datetime import datetime
+from pathlib import Path
 import plotly.graph_objects as go
 import plotly.express as px
 
 # Import custom modules
+import re
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -26,61 +28,12 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 2.5rem;
-        color: #1E3A8A;
-        text-align: center;
-        margin-bottom: 2rem;
-    }
-    .sub-header {
-        font-size: 1.8rem;
-        color: #2563EB;
-        margin-top: 2rem;
-        margin-bottom: 1rem;
-    }
-    .metric-card {
-        background-color: #F8FAFC;
-        padding: 1.5rem;
-        border-radius: 10px;
-        border-left: 5px solid #3B82F6;
-        margin-bottom: 1rem;
-    }
-    .metric-value {
-        font-size: 2rem;
-        font-weight: bold;
-        color: #1E3A8A;
-    }
-    .metric-label {
-        font-size: 1rem;
-        color: #64748B;
-    }
-    .positive {
-        color: #10B981;
-    }
-    .negative {
-        color: #EF4444;
-    }
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 10px;
-    }
-    .stTabs [data-baseweb="tab"] {
-        height: 50px;
-        white-space: pre-wrap;
-        background-color: #F1F5F9;
-        border-radius: 5px 5px 0px 0px;
-        gap: 1px;
-        padding-top: 10px;
-        padding-bottom: 10px;
-    }
-    .stTabs [aria-selected="true"] {
-        background-color: #3B82F6;
-        color: white;
-    }
-</style>
-""", unsafe_allow_html=True)
+# Custom CSS, loaded from disk once per process
+@st.cache_resource
+def _css() -> str:
+    return (Path(__file__).parent / 'assets' / 'style.css').read_text()
+
+st.markdown(f"<style>{_css()}</style>", unsafe_allow_html=True)
 
 # Initialize data loader
 @st.cache_resource
@@ -89,6 +42,46 @@ def load_data():
     success = loader.load_all_data()
     return loader if success else None
 
+# Cached lookups so reruns don't re-filter the underlying frames.
+# The leading underscore tells Streamlit not to hash the loader itself.
+@st.cache_data(show_spinner=False)
+def _get_ts(_loader, indicator_name):
+    return _loader.get_indicator_timeseries(indicator_name)
+
+@st.cache_data(show_spinner=False)
+def _get_fc(_loader, indicator, scenario):
+    return _loader.get_forecast_data(indicator, scenario)
+
+@st.cache_data(show_spinner=False)
+def _summary_csv(df: pd.DataFrame) -> bytes:
+    return df.to_csv(index=False).encode('utf-8')
+
+@st.cache_resource
+def _processor() -> ForecastProcessor:
+    return ForecastProcessor()
+
+# Figures pre-serialized by scripts/prebuild_figures.py; returns None
+# when no prebuilt JSON exists so callers fall back to building live
+@st.cache_resource(show_spinner=False)
+def _prebuilt_fig(key: str):
+    path = Path(__file__).parent / 'figures' / f'{key}.json'
+    if not path.exists():
+        return None
+    import plotly.io as pio
+    return pio.from_json(path.read_text(encoding='utf-8'))
+
+@st.cache_data(show_spinner=False)
+def _gauge_chart(current, target):
+    return DashboardVisualizations.create_gauge_chart(
+        current,
+        "Current Account Ownership",
+        target=target
+    )
+
+# Column patterns for the event-impacts table, compiled once at import
+_EVENT_COL_RE = re.compile(r'event', re.I)
+_IMPACT_COL_RE = re.compile(r'impact|estimate', re.I)
+
 def main():
     # Header
     st.markdown('<h1 class="main-header">📊 Ethiopia Financial Inclusion Forecasting Dashboard</h1>', unsafe_allow_html=True)
@@ -147,11 +140,11 @@ def main():
         st.markdown("---")
         st.markdown("## 📥 Data Export")
         
-        if data_loader.forecasts and 'summary' in data_loader.forecasts and data_loader.forecasts['summary'] is not None:
-            csv = data_loader.forecasts['summary'].to_csv(index=False)
+        summary = (data_loader.forecasts or {}).get('summary')
+        if summary is not None:
             st.download_button(
                 label="📄 Download Forecast Summary",
-                data=csv,
+                data=_summary_csv(summary),
                 file_name="ethiopia_fi_forecast_summary.csv",
                 mime="text/csv"
             )
@@ -177,58 +170,50 @@ def main():
     else:
         show_about_page()
 
+def _metric_card(value, label):
+    """Render a metric card as a single markdown element"""
+    st.markdown(f'''<div class="metric-card">
+  <div class="metric-value">{value}</div>
+  <div class="metric-label">{label}</div>
+</div>''', unsafe_allow_html=True)
+
+@st.fragment
 def show_overview_page(data_loader):
     """Overview page with key metrics"""
     st.markdown('<h2 class="sub-header">📈 Executive Overview</h2>', unsafe_allow_html=True)
-    
+
     # Key metrics in columns
     col1, col2, col3, col4 = st.columns(4)
-    
+
     with col1:
-        st.markdown('<div class="metric-card">', unsafe_allow_html=True)
         if 'latest_account_ownership' in data_loader.summary_stats:
             value = data_loader.summary_stats['latest_account_ownership']
             year = data_loader.summary_stats.get('account_ownership_year', '2024')
-            st.markdown(f'<div class="metric-value">{value:.1f}%</div>', unsafe_allow_html=True)
-            st.markdown(f'<div class="metric-label">Account Ownership ({year})</div>', unsafe_allow_html=True)
+            _metric_card(f'{value:.1f}%', f'Account Ownership ({year})')
         else:
-            st.markdown('<div class="metric-value">49.0%</div>', unsafe_allow_html=True)
-            st.markdown('<div class="metric-label">Account Ownership (2024)</div>', unsafe_allow_html=True)
-        st.markdown('</div>', unsafe_allow_html=True)
-    
+            _metric_card('49.0%', 'Account Ownership (2024)')
+
     with col2:
-        st.markdown('<div class="metric-card">', unsafe_allow_html=True)
         if 'latest_digital_payments' in data_loader.summary_stats:
             value = data_loader.summary_stats['latest_digital_payments']
-            st.markdown(f'<div class="metric-value">{value:.1f}%</div>', unsafe_allow_html=True)
-            st.markdown('<div class="metric-label">Digital Payment Usage</div>', unsafe_allow_html=True)
+            _metric_card(f'{value:.1f}%', 'Digital Payment Usage')
         else:
-            st.markdown('<div class="metric-value">35.0%</div>', unsafe_allow_html=True)
-            st.markdown('<div class="metric-label">Digital Payments (2024)</div>', unsafe_allow_html=True)
-        st.markdown('</div>', unsafe_allow_html=True)
-    
+            _metric_card('35.0%', 'Digital Payments (2024)')
+
     with col3:
-        st.markdown('<div class="metric-card">', unsafe_allow_html=True)
         if 'gender_gap' in data_loader.summary_stats:
             value = data_loader.summary_stats['gender_gap']
-            st.markdown(f'<div class="metric-value">{value:.1f}pp</div>', unsafe_allow_html=True)
-            st.markdown('<div class="metric-label">Gender Gap (2021)</div>', unsafe_allow_html=True)
+            _metric_card(f'{value:.1f}pp', 'Gender Gap (2021)')
         else:
-            st.markdown('<div class="metric-value">20.0pp</div>', unsafe_allow_html=True)
-            st.markdown('<div class="metric-label">Gender Gap</div>', unsafe_allow_html=True)
-        st.markdown('</div>', unsafe_allow_html=True)
-    
+            _metric_card('20.0pp', 'Gender Gap')
+
     with col4:
-        st.markdown('<div class="metric-card">', unsafe_allow_html=True)
         if 'p2p_atm_ratio' in data_loader.summary_stats:
             value = data_loader.summary_stats['p2p_atm_ratio']
             status = "✓ Surpassed" if data_loader.summary_stats.get('p2p_surpasses_atm', False) else "⬆ Growing"
-            st.markdown(f'<div class="metric-value">{value:.1f}x</div>', unsafe_allow_html=True)
-            st.markdown(f'<div class="metric-label">P2P/ATM Ratio ({status})</div>', unsafe_allow_html=True)
+            _metric_card(f'{value:.1f}x', f'P2P/ATM Ratio ({status})')
         else:
-            st.markdown('<div class="metric-value">1.08x</div>', unsafe_allow_html=True)
-            st.markdown('<div class="metric-label">P2P/ATM Ratio (Surpassed)</div>', unsafe_allow_html=True)
-        st.markdown('</div>', unsafe_allow_html=True)
+            _metric_card('1.08x', 'P2P/ATM Ratio (Surpassed)')
     
     # Growth highlights
     st.markdown('<h3 class="sub-header">📈 Growth Highlights</h3>', unsafe_allow_html=True)
@@ -255,23 +240,23 @@ def show_overview_page(data_loader):
                 delta="+35.7pp"
             )
         
-        # Gauge chart
-        fig = DashboardVisualizations.create_gauge_chart(
-            current,
-            "Current Account Ownership",
-            target=70  # NFIS-II target
-        )
+        # Gauge chart (cached by (current, target) so unrelated sidebar
+        # interactions don't rebuild the figure)
+        fig = _gauge_chart(current, 70)  # NFIS-II target
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         st.markdown("#### Key Market Events")
         events = data_loader.get_events_timeline()
         if events is not None:
-            for _, event in events.head(5).iterrows():
-                st.markdown(f"""
-                **{event['date'].year}**: {event['indicator']}
-                *Category*: {event['category'] if 'category' in event and pd.notna(event['category']) else 'N/A'}
-                """)
+            top = events.head(5)
+            # astype(object) first: the column is categorical, and 'N/A'
+            # is not one of its categories
+            categories = top.get('category', pd.Series(['N/A'] * len(top))) \
+                .astype(object).fillna('N/A')
+            lines = [f"**{date.year}**: {indicator}  \n*Category*: {category}"
+                     for date, indicator, category in zip(top['date'], top['indicator'], categories)]
+            st.markdown("\n\n".join(lines))
         else:
             st.markdown("""
             **2021**: Telebirr Launch
@@ -316,6 +301,7 @@ def show_overview_page(data_loader):
         - Strong event impact validation (95.9% accuracy)
         """)
 
+@st.fragment
 def show_trends_page(data_loader, date_range):
     """Trends analysis page"""
     st.markdown('<h2 class="sub-header">📊 Trends Analysis</h2>', unsafe_allow_html=True)
@@ -325,35 +311,39 @@ def show_trends_page(data_loader, date_range):
     selected_indicator = st.selectbox("Select Indicator to Analyze", indicators)
     
     # Get time series data
-    timeseries_data = data_loader.get_indicator_timeseries(selected_indicator)
+    timeseries_data = _get_ts(data_loader, selected_indicator)
     events_data = data_loader.get_events_timeline()
     
     if timeseries_data is not None and not timeseries_data.empty:
-        # Filter by date range
+        # Filter by date range (single between mask instead of two ANDed ones)
         if len(date_range) == 2:
-            start_date, end_date = date_range
+            start_date, end_date = map(pd.Timestamp, date_range)
             timeseries_data = timeseries_data[
-                (timeseries_data['date'] >= pd.Timestamp(start_date)) &
-                (timeseries_data['date'] <= pd.Timestamp(end_date))
+                timeseries_data['date'].between(start_date, end_date)
             ]
         
-        # Create visualization
+        # Create visualization (column arrays extracted once)
         fig = DashboardVisualizations.create_timeseries_plot(
-            timeseries_data,
+            timeseries_data['date'].to_numpy(),
+            timeseries_data['value_numeric'].to_numpy(),
             f"{selected_indicator} Trend",
             "Percentage (%)",
             color='#3B82F6',
+            gender_codes=timeseries_data['gender'].to_numpy()
+                if 'gender' in timeseries_data.columns else None,
             show_events=True,
             events_data=events_data
         )
         
         st.plotly_chart(fig, use_container_width=True)
         
-        # Data table
+        # Data table (dates stay datetime64; formatting happens on the front end)
         with st.expander("View Data Table"):
-            display_df = timeseries_data.copy()
-            display_df['date'] = display_df['date'].dt.strftime('%Y-%m-%d')
-            st.dataframe(display_df[['date', 'value_numeric', 'gender', 'location']], use_container_width=True)
+            st.dataframe(
+                timeseries_data[['date', 'value_numeric', 'gender', 'location']],
+                column_config={'date': st.column_config.DatetimeColumn(format='YYYY-MM-DD')},
+                use_container_width=True
+            )
     else:
         st.warning(f"No time series data available for {selected_indicator}")
         
@@ -398,6 +388,7 @@ def show_trends_page(data_loader, date_range):
         - Female/Male Ratio: 64%
         """)
 
+@st.fragment
 def show_forecasts_page(data_loader, scenario):
     """Forecasts page"""
     st.markdown('<h2 class="sub-header">🔮 Inclusion Forecasts 2025-2027</h2>', unsafe_allow_html=True)
@@ -418,31 +409,34 @@ def show_forecasts_page(data_loader, scenario):
         st.markdown("#### Account Ownership Forecast (Access)")
         
         # Get historical data
-        historical_data = data_loader.get_indicator_timeseries('Account Ownership Rate')
+        historical_data = _get_ts(data_loader, 'Account Ownership Rate')
         
         # Get forecast data
-        forecast_data = data_loader.get_forecast_data('Account Ownership', scenario)
+        forecast_data = _get_fc(data_loader, 'Account Ownership', scenario)
         
         if forecast_data is not None:
-            # Create forecast plot
-            fig = DashboardVisualizations.create_forecast_plot(
-                historical_data,
-                forecast_data,
-                f"Account Ownership Forecast ({scenario.title()} Scenario)",
-                scenario
-            )
+            # Prebuilt figure if available, else build live
+            fig = _prebuilt_fig(f'forecast_account_ownership_{scenario}')
+            if fig is None:
+                fig = DashboardVisualizations.create_forecast_plot(
+                    historical_data,
+                    forecast_data,
+                    f"Account Ownership Forecast ({scenario.title()} Scenario)",
+                    scenario
+                )
             st.plotly_chart(fig, use_container_width=True)
             
             # Forecast table
             st.markdown("#### Forecast Values")
             current_value = data_loader.summary_stats.get('latest_account_ownership', 49.0)
-            display_df = forecast_data.copy()
-            display_df['Growth from 2024'] = display_df['value'] - current_value
-            display_df['Growth from 2024'] = display_df['Growth from 2024'].apply(lambda x: f'{x:+.1f}pp')
-            st.dataframe(display_df, use_container_width=True)
+            st.dataframe(
+                forecast_data.assign(**{'Growth from 2024': forecast_data['value'] - current_value}),
+                column_config={'Growth from 2024': st.column_config.NumberColumn(format="%+.1fpp")},
+                use_container_width=True
+            )
             
             # Milestones
-            processor = ForecastProcessor()
+            processor = _processor()
             milestones = processor.get_milestones(forecast_data, [60, 70, 80, 90])
             
             if milestones:
@@ -462,34 +456,33 @@ def show_forecasts_page(data_loader, scenario):
     with forecast_tabs[1]:
         st.markdown("#### Digital Payment Usage Forecast (Usage)")
         
-        # Get historical data
+        # Get historical data (single lookup across the alternative names)
         historical_names = ['USG_DIGITAL_PAYMENT', 'Digital Payment Usage Rate']
-        historical_data = None
-        for name in historical_names:
-            historical_data = data_loader.get_indicator_timeseries(name)
-            if historical_data is not None:
-                break
+        historical_data = data_loader.get_indicator_timeseries_any(historical_names)
         
         # Get forecast data
-        forecast_data = data_loader.get_forecast_data('Digital Payments', scenario)
+        forecast_data = _get_fc(data_loader, 'Digital Payments', scenario)
         
         if forecast_data is not None:
-            # Create forecast plot
-            fig = DashboardVisualizations.create_forecast_plot(
-                historical_data,
-                forecast_data,
-                f"Digital Payment Usage Forecast ({scenario.title()} Scenario)",
-                scenario
-            )
+            # Prebuilt figure if available, else build live
+            fig = _prebuilt_fig(f'forecast_digital_payments_{scenario}')
+            if fig is None:
+                fig = DashboardVisualizations.create_forecast_plot(
+                    historical_data,
+                    forecast_data,
+                    f"Digital Payment Usage Forecast ({scenario.title()} Scenario)",
+                    scenario
+                )
             st.plotly_chart(fig, use_container_width=True)
             
             # Forecast table
             st.markdown("#### Forecast Values")
             current_value = data_loader.summary_stats.get('latest_digital_payments', 35.0)
-            display_df = forecast_data.copy()
-            display_df['Growth from 2024'] = display_df['value'] - current_value
-            display_df['Growth from 2024'] = display_df['Growth from 2024'].apply(lambda x: f'{x:+.1f}pp')
-            st.dataframe(display_df, use_container_width=True)
+            st.dataframe(
+                forecast_data.assign(**{'Growth from 2024': forecast_data['value'] - current_value}),
+                column_config={'Growth from 2024': st.column_config.NumberColumn(format="%+.1fpp")},
+                use_container_width=True
+            )
         else:
             st.warning("Digital payment forecast data not available")
             # Show static forecast
@@ -506,7 +499,7 @@ def show_forecasts_page(data_loader, scenario):
         # Get all scenarios for account ownership
         scenarios_data = {}
         for sc in ['base', 'optimistic', 'pessimistic']:
-            scenarios_data[sc] = data_loader.get_forecast_data('Account Ownership', sc)
+            scenarios_data[sc] = _get_fc(data_loader, 'Account Ownership', sc)
         
         # Create comparison chart
         fig = DashboardVisualizations.create_scenario_comparison(
@@ -517,22 +510,14 @@ def show_forecasts_page(data_loader, scenario):
         
         # Comparison table
         st.markdown("#### Scenario Comparison Table")
-        comparison_data = []
-        for sc, data in scenarios_data.items():
-            if data is not None:
-                for _, row in data.iterrows():
-                    comparison_data.append({
-                        'Year': row['year'],
-                        'Scenario': sc.title(),
-                        'Forecast': row['value']
-                    })
-        
-        if comparison_data:
-            comparison_df = pd.DataFrame(comparison_data)
-            pivot_df = comparison_df.pivot_table(
-                index='Year',
+        frames = [data.assign(Scenario=sc.title()) for sc, data in scenarios_data.items() if data is not None]
+
+        if frames:
+            comparison_df = pd.concat(frames, ignore_index=True)
+            pivot_df = comparison_df.pivot(
+                index='year',
                 columns='Scenario',
-                values='Forecast'
+                values='value'
             )
             st.dataframe(pivot_df, use_container_width=True)
         else:
@@ -547,37 +532,24 @@ def show_forecasts_page(data_loader, scenario):
         st.markdown("#### Event Impact Analysis")
         
         if data_loader.event_impacts is not None:
-            # Check what columns are available
+            # Find relevant columns (first match wins)
             available_cols = data_loader.event_impacts.columns.tolist()
-            
-            # Try to find relevant columns
-            event_col = None
-            impact_col = None
-            
-            for col in available_cols:
-                if 'event' in col.lower():
-                    event_col = col
-                if 'impact' in col.lower() or 'estimate' in col.lower():
-                    impact_col = col
+            event_col = next((c for c in available_cols if _EVENT_COL_RE.search(c)), None)
+            impact_col = next((c for c in available_cols if _IMPACT_COL_RE.search(c)), None)
             
             if event_col and impact_col:
-                # Create simplified impact data
-                impact_data = []
-                
-                for _, row in data_loader.event_impacts.iterrows():
-                    event_name = row[event_col] if pd.notna(row[event_col]) else 'Unknown Event'
-                    impact_value = float(row[impact_col]) if pd.notna(row[impact_col]) else 0
-                    
-                    if impact_value != 0:
-                        impact_data.append({
-                            'Event': event_name,
-                            'Impact (pp)': impact_value,
-                            'Direction': 'Positive' if impact_value > 0 else 'Negative'
-                        })
-                
-                if impact_data:
-                    impact_df = pd.DataFrame(impact_data)
-                    
+                # Create simplified impact data with column operations
+                impact_df = data_loader.event_impacts[[event_col, impact_col]].rename(
+                    columns={event_col: 'Event', impact_col: 'Impact (pp)'}
+                ).dropna(subset=['Impact (pp)'])
+                impact_df['Impact (pp)'] = impact_df['Impact (pp)'].astype(float)
+                impact_df = impact_df[impact_df['Impact (pp)'] != 0]
+                impact_df['Event'] = impact_df['Event'].fillna('Unknown Event')
+                impact_df['Direction'] = np.where(impact_df['Impact (pp)'] > 0, 'Positive', 'Negative')
+                impact_df = impact_df.reset_index(drop=True)
+
+                if not impact_df.empty:
+
                     fig = DashboardVisualizations.create_event_impact_chart(
                         impact_df,
                         "Event Impacts"
@@ -628,6 +600,7 @@ def show_forecasts_page(data_loader, scenario):
             - Pass Rate: 66.7%
             """)
 
+@st.fragment
 def show_projections_page(data_loader):
     """Inclusion projections page"""
     st.markdown('<h2 class="sub-header">🎯 Inclusion Projections & Targets</h2>', unsafe_allow_html=True)
@@ -646,7 +619,7 @@ def show_projections_page(data_loader):
     current_value = data_loader.summary_stats.get('latest_account_ownership', 49.0)
     
     if forecast_2025:
-        processor = ForecastProcessor()
+        processor = _processor()
         target_analysis = processor.analyze_nfis_target_gap(current_value, forecast_2025)
         
         if target_analysis:
@@ -688,35 +661,34 @@ def show_projections_page(data_loader):
                 'Target': [current_value, 70.0]
             })
             
-            fig = go.Figure()
-            
-            # Actual/Forecast line
-            fig.add_trace(go.Scatter(
-                x=progress_data['Year'],
-                y=progress_data['Actual/Forecast'],
-                mode='lines+markers+text',
-                name='Actual/Forecast',
-                line=dict(color='blue', width=4),
-                marker=dict(size=12),
-                text=[f"{current_value:.1f}%", f"{forecast_2025:.1f}%"],
-                textposition="top center"
-            ))
-            
-            # Target line
-            fig.add_trace(go.Scatter(
-                x=progress_data['Year'],
-                y=progress_data['Target'],
-                mode='lines+markers+text',
-                name='NFIS-II Target',
-                line=dict(color='red', width=4, dash='dash'),
-                marker=dict(size=12),
-                text=["", "70.0%"],
-                textposition="top center"
-            ))
-            
+            # Build all traces up front; a single Figure constructor call
+            # avoids per-add_trace revalidation
+            traces = [
+                go.Scattergl(
+                    x=progress_data['Year'],
+                    y=progress_data['Actual/Forecast'],
+                    mode='lines+markers+text',
+                    name='Actual/Forecast',
+                    line=dict(color='blue', width=4),
+                    marker=dict(size=12),
+                    text=[f"{current_value:.1f}%", f"{forecast_2025:.1f}%"],
+                    textposition="top center"
+                ),
+                go.Scattergl(
+                    x=progress_data['Year'],
+                    y=progress_data['Target'],
+                    mode='lines+markers+text',
+                    name='NFIS-II Target',
+                    line=dict(color='red', width=4, dash='dash'),
+                    marker=dict(size=12),
+                    text=["", "70.0%"],
+                    textposition="top center"
+                )
+            ]
+
             # Fill gap area
             if target_analysis['gap'] > 0:
-                fig.add_trace(go.Scatter(
+                traces.append(go.Scattergl(
                     x=[2025, 2025],
                     y=[forecast_2025, 70],
                     fill='tozerox',
@@ -725,15 +697,15 @@ def show_projections_page(data_loader):
                     showlegend=False,
                     name='Target Gap'
                 ))
-            
-            fig.update_layout(
+
+            fig = go.Figure(data=traces, layout=dict(
                 title="Progress Toward NFIS-II Target",
                 xaxis_title="Year",
                 yaxis_title="Account Ownership (%)",
                 template='plotly_white',
                 height=400
-            )
-            
+            ))
+
             st.plotly_chart(fig, use_container_width=True)
     else:
         # Static target analysis
@@ -814,6 +786,7 @@ def show_projections_page(data_loader):
         - Stakeholder feedback integration
         """)
 
+@st.fragment
 def show_about_page():
     """About page"""
     st.markdown('<h2 class="sub-header">📋 About This Dashboard</h2>', unsafe_allow_html=True)
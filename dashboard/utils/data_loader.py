@@ -5,8 +5,63 @@ import pandas as pd
 import numpy as np
 import json
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import os
 
+import streamlit as st
+
+@st.cache_data(show_spinner=False)
+def _read_table(path, mtime, **read_csv_kwargs):
+    """
+    Read a data file, cached on (path, mtime)
+
+    Prefers a Parquet sibling when one exists (written by
+    scripts/convert_csv_to_parquet.py) — Parquet is columnar and typed,
+    so it loads several times faster than re-parsing CSV text. The
+    mtime argument is only a cache key: edits to the file on disk
+    invalidate the cached frame.
+    """
+    parquet_path = os.path.splitext(path)[0] + '.parquet'
+    if os.path.exists(parquet_path):
+        # The converter writes siblings straight from the raw CSV (string
+        # dates, inferred dtypes), so the schema hints read_csv would get
+        # are applied here too; index_col files round-trip their index
+        usecols = read_csv_kwargs.get('usecols')
+        df = pd.read_parquet(parquet_path, engine='pyarrow',
+                             columns=list(usecols) if usecols is not None else None)
+        for col in read_csv_kwargs.get('parse_dates') or ():
+            if df[col].dtype.kind != 'M':
+                df[col] = pd.to_datetime(df[col])
+        for col, dtype in (read_csv_kwargs.get('dtype') or {}).items():
+            if col in df.columns:
+                df[col] = df[col].astype(dtype)
+        return df
+    return pd.read_csv(path, **read_csv_kwargs)
+
+def _load_table(path, **read_csv_kwargs):
+    """Load a table through the rerun cache, keyed by file mtime"""
+    return _read_table(path, os.path.getmtime(path), **read_csv_kwargs)
+
+# Only the columns the dashboard reads, with their known types — parsing a
+# fixed schema skips dtype inference and the unused columns entirely
+_ENRICHED_USECOLS = ['indicator', 'record_type', 'observation_date', 'value_numeric',
+                     'gender', 'location', 'source_name', 'category']
+_ENRICHED_DTYPES = {'indicator': 'category', 'record_type': 'category',
+                    'gender': 'category', 'location': 'category',
+                    'source_name': 'category', 'category': 'category',
+                    'value_numeric': 'float32'}
+
+def _narrow_dtypes(df):
+    """Downcast floats and categorize repeated string columns to cut memory"""
+    if df is None:
+        return None
+    for col in df.select_dtypes('float64').columns:
+        df[col] = df[col].astype('float32')
+    for col in ('indicator', 'record_type', 'gender', 'location', 'scenario', 'category', 'source_name'):
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    return df
+
 class DashboardDataLoader:
     """Loads and prepares data for the dashboard"""
     
@@ -17,6 +72,9 @@ class DashboardDataLoader:
         self.event_impacts = None
         self.validation_results = None
         self.summary_stats = {}
+        self._by_indicator = None
+        self._series_cache = {}
+        self._forecast_cache = {}
         
     def load_all_data(self):
         """Load all required data files"""
@@ -27,8 +85,15 @@ class DashboardDataLoader:
             # Load enriched data
             enriched_path = os.path.join(base_dir, 'data', 'processed', 'ethiopia_fi_enriched.csv')
             if os.path.exists(enriched_path):
-                self.enriched_data = pd.read_csv(enriched_path, encoding='utf-8')
+                self.enriched_data = _load_table(
+                    enriched_path, encoding='utf-8', usecols=_ENRICHED_USECOLS,
+                    dtype=_ENRICHED_DTYPES, parse_dates=['observation_date']
+                )
                 print(f"✓ Loaded enriched data: {len(self.enriched_data)} records")
+                # Sorted (indicator, record_type) index so per-indicator
+                # lookups descend the index instead of scanning the table
+                self._by_indicator = self.enriched_data.sort_values('observation_date') \
+                    .set_index(['indicator', 'record_type']).sort_index(kind='stable')
             else:
                 print(f"✗ Enriched data not found: {enriched_path}")
                 return False
@@ -42,49 +107,63 @@ class DashboardDataLoader:
                 'digital_payment_scenarios': 'digital_payment_scenarios.csv',
                 'summary': 'forecast_summary.csv'
             }
-            
-            for key, filename in forecast_files.items():
-                filepath = os.path.join(base_dir, 'models', filename)
-                try:
+
+            # The model files are independent reads and pandas' C parser
+            # releases the GIL, so loading them through a thread pool
+            # overlaps disk I/O and parsing instead of serializing it
+            matrix_path = os.path.join(base_dir, 'models', 'association_matrix.csv')
+            impact_path = os.path.join(base_dir, 'models', 'impact_summary.csv')
+            validation_path = os.path.join(base_dir, 'models', 'validation_results.csv')
+
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                forecast_futures = {}
+                for key, filename in forecast_files.items():
+                    filepath = os.path.join(base_dir, 'models', filename)
                     if os.path.exists(filepath):
-                        self.forecasts[key] = pd.read_csv(filepath)
-                        print(f"✓ Loaded forecast: {filename}")
+                        forecast_futures[key] = executor.submit(_load_table, filepath)
                     else:
                         print(f"⚠ Forecast not found: {filename}")
                         self.forecasts[key] = None
-                except Exception as e:
-                    print(f"✗ Error loading {filename}: {str(e)}")
-                    self.forecasts[key] = None
-            
-            # Load association matrix
-            matrix_path = os.path.join(base_dir, 'models', 'association_matrix.csv')
-            if os.path.exists(matrix_path):
-                self.association_matrix = pd.read_csv(matrix_path, index_col=0)
+
+                matrix_future = executor.submit(_load_table, matrix_path, index_col=0) \
+                    if os.path.exists(matrix_path) else None
+                impact_future = executor.submit(_load_table, impact_path) \
+                    if os.path.exists(impact_path) else None
+                validation_future = executor.submit(_load_table, validation_path) \
+                    if os.path.exists(validation_path) else None
+
+                for key, future in forecast_futures.items():
+                    try:
+                        self.forecasts[key] = _narrow_dtypes(future.result())
+                        print(f"✓ Loaded forecast: {forecast_files[key]}")
+                    except Exception as e:
+                        print(f"✗ Error loading {forecast_files[key]}: {str(e)}")
+                        self.forecasts[key] = None
+
+            if matrix_future is not None:
+                self.association_matrix = matrix_future.result()
                 print(f"✓ Loaded association matrix")
             else:
                 print("⚠ Association matrix not found")
                 self.association_matrix = None
-            
-            # Load impact summary
-            impact_path = os.path.join(base_dir, 'models', 'impact_summary.csv')
-            if os.path.exists(impact_path):
-                self.event_impacts = pd.read_csv(impact_path)
+
+            if impact_future is not None:
+                self.event_impacts = impact_future.result()
                 print(f"✓ Loaded impact summary: {len(self.event_impacts)} records")
             else:
                 print("⚠ Impact summary not found")
                 self.event_impacts = None
-            
-            # Load validation results
-            validation_path = os.path.join(base_dir, 'models', 'validation_results.csv')
-            if os.path.exists(validation_path):
-                self.validation_results = pd.read_csv(validation_path)
+
+            if validation_future is not None:
+                self.validation_results = validation_future.result()
                 print(f"✓ Loaded validation results")
             else:
                 print("⚠ Validation results not found")
                 self.validation_results = None
             
-            # Calculate summary statistics
-            self._calculate_summary_stats()
+            # Calculate summary statistics (or load the precomputed sidecar)
+            stats_path = os.path.join(base_dir, 'data', 'processed', 'summary_stats.json')
+            self._load_summary_stats(stats_path, os.path.getmtime(enriched_path))
             
             print("✅ All data loaded successfully")
             return True
@@ -93,60 +172,77 @@ class DashboardDataLoader:
             print(f"❌ Error loading data: {str(e)}")
             return False
     
+    def _load_summary_stats(self, stats_path, source_mtime):
+        """Load precomputed summary stats, computing and caching them on miss
+
+        The stats are a deterministic function of the enriched dataset,
+        so they are written to a JSON sidecar alongside the source
+        file's mtime; a sidecar recorded against a different mtime (or
+        in the old format without one) is recomputed instead of served
+        stale after the data is regenerated.
+        """
+        try:
+            with open(stats_path, encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get('source_mtime') == source_mtime:
+                self.summary_stats = cached['stats']
+                return
+        except (OSError, ValueError, AttributeError):
+            pass
+
+        self._calculate_summary_stats()
+
+        try:
+            with open(stats_path, 'w', encoding='utf-8') as f:
+                json.dump({'source_mtime': source_mtime,
+                           'stats': {key: value.item() if hasattr(value, 'item') else value
+                                     for key, value in self.summary_stats.items()}},
+                          f, indent=2)
+        except OSError:
+            pass  # read-only deployments just recompute each cold start
+
     def _calculate_summary_stats(self):
         """Calculate key summary statistics"""
-        
-        # Latest account ownership
+
         if self.enriched_data is not None:
-            account_data = self.enriched_data[
-                (self.enriched_data['indicator'] == 'Account Ownership Rate') &
-                (self.enriched_data['record_type'] == 'observation')
-            ]
-            if not account_data.empty:
-                account_data = account_data.sort_values('observation_date')
+            # One date sort and one groupby instead of a full-frame boolean
+            # scan per statistic
+            df = self.enriched_data.sort_values('observation_date')
+            obs = df[df['record_type'] == 'observation']
+            grouped = {indicator: group for indicator, group
+                       in obs.groupby('indicator', sort=False, observed=True)}
+
+            # Latest account ownership
+            account_data = grouped.get('Account Ownership Rate')
+            if account_data is not None and not account_data.empty:
                 self.summary_stats['latest_account_ownership'] = account_data['value_numeric'].iloc[-1]
-                self.summary_stats['account_ownership_year'] = account_data['observation_date'].iloc[-1][:4]
-        
-        # Latest digital payments
-        if self.enriched_data is not None:
-            digital_data = self.enriched_data[
-                (self.enriched_data['indicator'].str.contains('Digital Payment', na=False)) &
-                (self.enriched_data['record_type'] == 'observation')
-            ]
+                self.summary_stats['account_ownership_year'] = account_data['observation_date'].iloc[-1].year
+
+            # Latest digital payments
+            digital_data = obs[obs['indicator'].str.contains('Digital Payment', na=False, regex=False)]
             if not digital_data.empty:
-                digital_data = digital_data.sort_values('observation_date')
                 self.summary_stats['latest_digital_payments'] = digital_data['value_numeric'].iloc[-1]
-        
-        # Gender gap
-        if self.enriched_data is not None:
-            gender_data_2021 = self.enriched_data[
-                (self.enriched_data['indicator'] == 'Account Ownership Rate') &
-                (self.enriched_data['gender'].isin(['male', 'female'])) &
-                (self.enriched_data['observation_date'].str.contains('2021'))
+
+            # Gender gap
+            gender_data_2021 = df[
+                (df['indicator'] == 'Account Ownership Rate') &
+                (df['gender'].isin(['male', 'female'])) &
+                (df['observation_date'].dt.year == 2021)
             ]
             if len(gender_data_2021) >= 2:
                 male_val = gender_data_2021[gender_data_2021['gender'] == 'male']['value_numeric'].values[0]
                 female_val = gender_data_2021[gender_data_2021['gender'] == 'female']['value_numeric'].values[0]
                 self.summary_stats['gender_gap'] = male_val - female_val
-        
-        # P2P/ATM ratio
-        if self.enriched_data is not None:
-            p2p_data = self.enriched_data[
-                (self.enriched_data['indicator'] == 'P2P Transaction Count') &
-                (self.enriched_data['record_type'] == 'observation')
-            ]
-            atm_data = self.enriched_data[
-                (self.enriched_data['indicator'] == 'ATM Transaction Count') &
-                (self.enriched_data['record_type'] == 'observation')
-            ]
-            
-            if not p2p_data.empty and not atm_data.empty:
-                p2p_data = p2p_data.sort_values('observation_date')
-                atm_data = atm_data.sort_values('observation_date')
-                
+
+            # P2P/ATM ratio
+            p2p_data = grouped.get('P2P Transaction Count')
+            atm_data = grouped.get('ATM Transaction Count')
+
+            if p2p_data is not None and atm_data is not None \
+                    and not p2p_data.empty and not atm_data.empty:
                 latest_p2p = p2p_data['value_numeric'].iloc[-1]
                 latest_atm = atm_data['value_numeric'].iloc[-1]
-                
+
                 if latest_atm > 0:
                     self.summary_stats['p2p_atm_ratio'] = latest_p2p / latest_atm
                     self.summary_stats['p2p_surpasses_atm'] = latest_p2p > latest_atm
@@ -160,38 +256,76 @@ class DashboardDataLoader:
     
     def get_indicator_timeseries(self, indicator_name):
         """Get time series data for an indicator"""
-        if self.enriched_data is None:
+        # Streamlit re-runs pages on every interaction; hand back the
+        # frame built on the first call instead of re-slicing
+        if indicator_name not in self._series_cache:
+            self._series_cache[indicator_name] = self._compute_series(indicator_name)
+        return self._series_cache[indicator_name]
+
+    def _compute_series(self, indicator_name):
+        """Build the time series frame for an indicator"""
+        if self._by_indicator is None:
             return None
-        
-        indicator_data = self.enriched_data[
-            (self.enriched_data['indicator'] == indicator_name) &
-            (self.enriched_data['record_type'] == 'observation')
-        ].copy()
-        
+
+        try:
+            # Index lookup; rows are already date-sorted from load time
+            indicator_data = self._by_indicator.loc[[(indicator_name, 'observation')]]
+        except KeyError:
+            return None
+
         if indicator_data.empty:
             return None
-        
-        indicator_data['date'] = pd.to_datetime(indicator_data['observation_date'])
-        indicator_data = indicator_data.sort_values('date')
-        
-        return indicator_data[['date', 'value_numeric', 'gender', 'location', 'source_name']]
+
+        return indicator_data[['observation_date', 'value_numeric', 'gender', 'location', 'source_name']] \
+            .rename(columns={'observation_date': 'date'}).reset_index(drop=True)
     
+    def get_indicator_timeseries_any(self, indicator_names):
+        """Get time series for the first of several alternative indicator names"""
+        if self.enriched_data is None:
+            return None
+
+        # One isin scan instead of a full filter per candidate name
+        present = self.enriched_data.loc[
+            (self.enriched_data['indicator'].isin(indicator_names)) &
+            (self.enriched_data['record_type'] == 'observation'),
+            'indicator'
+        ]
+        if present.empty:
+            return None
+
+        matches = set(present)
+        for name in indicator_names:
+            if name in matches:
+                return self.get_indicator_timeseries(name)
+        return None
+
     def get_events_timeline(self):
         """Get timeline of events"""
         if self.enriched_data is None:
             return None
         
-        events = self.enriched_data[self.enriched_data['record_type'] == 'event'].copy()
+        # The boolean filter already materializes a new frame, and nothing
+        # below mutates in place, so no defensive copy is needed
+        events = self.enriched_data[self.enriched_data['record_type'] == 'event']
         if events.empty:
             return None
-        
-        events['date'] = pd.to_datetime(events['observation_date'])
-        events = events.sort_values('date')
-        
-        return events[['date', 'indicator', 'category', 'source_name']]
+
+        # observation_date is already datetime64 from load time; drop any
+        # unparsable dates so consumers can rely on a NaT-free column
+        events = events.dropna(subset=['observation_date']).sort_values('observation_date')
+
+        return events[['observation_date', 'indicator', 'category', 'source_name']] \
+            .rename(columns={'observation_date': 'date'})
     
     def get_forecast_data(self, indicator, scenario='base'):
         """Get forecast data for an indicator and scenario"""
+        key = (indicator, scenario)
+        if key not in self._forecast_cache:
+            self._forecast_cache[key] = self._compute_forecast(indicator, scenario)
+        return self._forecast_cache[key]
+
+    def _compute_forecast(self, indicator, scenario):
+        """Build the forecast frame for an indicator and scenario"""
         indicator_map = {
             'Account Ownership': 'account_ownership',
             'Digital Payments': 'digital_payments'
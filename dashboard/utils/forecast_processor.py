@@ -12,12 +12,14 @@ class ForecastProcessor:
         """Calculate growth rates from historical to forecast"""
         if historical_value is None or forecast_values is None:
             return None
-        
-        growth = {}
-        for year, forecast in forecast_values.items():
-            growth[year] = forecast - historical_value
-        
-        return growth
+
+        # dict input: one fromiter pass and one array subtraction
+        if isinstance(forecast_values, dict):
+            values = np.fromiter(forecast_values.values(), dtype=float, count=len(forecast_values))
+            return dict(zip(forecast_values.keys(), values - historical_value))
+
+        # Series/ndarray inputs subtract in one vectorized op
+        return forecast_values - historical_value
     
     @staticmethod
     def calculate_annual_growth_rate(start_value, end_value, years):
@@ -34,24 +36,33 @@ class ForecastProcessor:
         if forecast_data is None or len(forecast_data) < 2:
             return None
         
-        milestone_years = {}
-        
-        for milestone in milestones:
-            # Find when forecast crosses milestone
-            for i in range(len(forecast_data) - 1):
-                year1 = forecast_data.iloc[i]['year']
-                value1 = forecast_data.iloc[i]['value']
-                year2 = forecast_data.iloc[i + 1]['year']
-                value2 = forecast_data.iloc[i + 1]['value']
-                
-                if value1 <= milestone <= value2:
-                    # Linear interpolation
-                    fraction = (milestone - value1) / (value2 - value1)
-                    milestone_year = year1 + fraction * (year2 - year1)
-                    milestone_years[milestone] = round(milestone_year, 1)
-                    break
-        
-        return milestone_years
+        years = forecast_data['year'].to_numpy(dtype=np.float64)
+        values = forecast_data['value'].to_numpy(dtype=np.float64)
+
+        # searchsorted needs monotonic values; a forecast that dips falls
+        # back to scanning consecutive segments for the first crossing
+        # (sorting values alone would pair them with the wrong years)
+        if not np.all(np.diff(values) >= 0):
+            milestone_years = {}
+            for milestone in milestones:
+                for i in range(len(values) - 1):
+                    if values[i] <= milestone <= values[i + 1]:
+                        fraction = (milestone - values[i]) / (values[i + 1] - values[i])
+                        milestone_years[milestone] = round(
+                            float(years[i] + fraction * (years[i + 1] - years[i])), 1)
+                        break
+            return milestone_years
+
+        # Locate every crossing at once, then interpolate vectorized
+        milestones_arr = np.asarray(milestones, dtype=np.float64)
+        idx = np.clip(np.searchsorted(values, milestones_arr), 1, len(values) - 1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            fraction = (milestones_arr - values[idx - 1]) / (values[idx] - values[idx - 1])
+        crossings = years[idx - 1] + fraction * (years[idx] - years[idx - 1])
+        reached = (milestones_arr >= values[0]) & (milestones_arr <= values[-1])
+
+        return {milestone: round(float(year), 1)
+                for milestone, year, ok in zip(milestones, crossings, reached) if ok}
     
     @staticmethod
     def analyze_nfis_target_gap(current_value, forecast_2025, target_2025=70):
@@ -5,103 +5,186 @@ import plotly.graph_objects as go
 import plotly.express as px
 import pandas as pd
 import numpy as np
+import streamlit as st
 from datetime import datetime
 
+# Shared settings for the figure caches below: figures are rebuilt only
+# when their input frames actually change, and the custom DataFrame hash
+# (shape plus pandas row-hash sum) is far cheaper than Streamlit's
+# default pickling
+_FIGURE_CACHE = dict(
+    max_entries=32,
+    show_spinner=False,
+    hash_funcs={pd.DataFrame: lambda df: (df.shape, pd.util.hash_pandas_object(df).sum())},
+)
+
+# Layout settings shared by every line/bar figure — built once instead of
+# re-allocating the same dicts per figure
+_BASE_LAYOUT = dict(
+    hovermode='x unified',
+    template='plotly_white',
+    height=500,
+    legend=dict(
+        orientation="h",
+        yanchor="bottom",
+        y=1.02,
+        xanchor="right",
+        x=1
+    )
+)
+
+# Maximum points shipped to the browser per line trace; longer series are
+# downsampled with LTTB before plotting
+MAX_POINTS_PER_TRACE = 1500
+
+def lttb_downsample(x, y, n_out=MAX_POINTS_PER_TRACE):
+    """
+    Downsample a series with Largest-Triangle-Three-Buckets (LTTB)
+
+    Keeps the visually dominant points of a long series so Plotly only
+    renders ~n_out points instead of the full resolution.
+
+    Args:
+        x: x values (datetime64 or numeric array)
+        y: y values (numeric array)
+        n_out: Maximum number of points to keep
+
+    Returns:
+        Tuple of (x, y) arrays with at most n_out points
+    """
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+
+    if n_out >= n or n_out < 3:
+        return x, y
+
+    # Work on a numeric view of x for the triangle areas
+    x_num = x.astype('int64').astype(float) if x.dtype.kind == 'M' else x.astype(float)
+
+    # Bucket boundaries over the interior points; endpoints are always kept
+    edges = np.linspace(1, n - 1, n_out - 1, dtype=np.int64)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0] = 0
+    keep[-1] = n - 1
+
+    anchor = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], max(edges[i] + 1, edges[i + 1])
+
+        # Average of the next bucket (or the last point for the final bucket)
+        if i + 2 < n_out - 1:
+            nxt_lo, nxt_hi = edges[i + 1], max(edges[i + 1] + 1, edges[i + 2])
+        else:
+            nxt_lo, nxt_hi = n - 1, n
+        avg_x = x_num[nxt_lo:nxt_hi].mean()
+        avg_y = y[nxt_lo:nxt_hi].mean()
+
+        # Pick the bucket point forming the largest triangle with the
+        # previous kept point and the next bucket's average
+        areas = np.abs(
+            (x_num[anchor] - avg_x) * (y[lo:hi] - y[anchor]) -
+            (x_num[anchor] - x_num[lo:hi]) * (avg_y - y[anchor])
+        )
+        anchor = lo + int(np.argmax(areas))
+        keep[i + 1] = anchor
+
+    return x[keep], y[keep]
+
 class DashboardVisualizations:
     """Creates interactive visualizations for the dashboard"""
     
     @staticmethod
-    def create_timeseries_plot(data, title, yaxis_title, color='blue', show_events=False, events_data=None):
-        """Create interactive time series plot - SIMPLIFIED VERSION"""
+    @st.cache_data(**_FIGURE_CACHE)
+    def create_timeseries_plot(dates, values, title, yaxis_title, color='blue',
+                               gender_codes=None, show_events=False, events_data=None):
+        """Create interactive time series plot from typed numpy arrays"""
         fig = go.Figure()
-        
-        # Add main time series
-        fig.add_trace(go.Scatter(
-            x=data['date'],
-            y=data['value_numeric'],
+
+        # Add main time series (downsampled if longer than the point budget)
+        x_vals, y_vals = lttb_downsample(dates, values)
+        fig.add_trace(go.Scattergl(
+            x=x_vals,
+            y=y_vals,
             mode='lines+markers',
             name=title,
             line=dict(color=color, width=3),
             marker=dict(size=8),
             hovertemplate='Date: %{x|%Y-%m-%d}<br>Value: %{y:.1f}%<extra></extra>'
         ))
-        
-        # Add gender breakdown if available
-        if 'gender' in data.columns and data['gender'].nunique() > 1:
-            for gender in data['gender'].unique():
-                gender_data = data[data['gender'] == gender]
-                if not gender_data.empty:
-                    fig.add_trace(go.Scatter(
-                        x=gender_data['date'],
-                        y=gender_data['value_numeric'],
+
+        # Add gender breakdown if available — one unique scan, then
+        # boolean masks on the arrays instead of frame filters
+        if gender_codes is not None:
+            gender_codes = np.asarray(gender_codes, dtype=object)
+            genders = pd.unique(gender_codes[pd.notna(gender_codes)])
+            if len(genders) > 1:
+                for gender in genders:
+                    mask = gender_codes == gender
+                    fig.add_trace(go.Scattergl(
+                        x=dates[mask],
+                        y=values[mask],
                         mode='lines+markers',
-                        name=f'{gender.title()}',
+                        name=f'{str(gender).title()}',
                         line=dict(dash='dash', width=2),
-                        hovertemplate='Gender: ' + gender + '<br>Date: %{x|%Y-%m-%d}<br>Value: %{y:.1f}%<extra></extra>'
+                        hovertemplate='Gender: ' + str(gender) + '<br>Date: %{x|%Y-%m-%d}<br>Value: %{y:.1f}%<extra></extra>'
                     ))
         
-        # Add events if requested - SIMPLIFIED APPROACH
-        if show_events and events_data is not None:
-            # Ensure we have valid datetime
-            events_data = events_data.copy()
-            if 'date' in events_data.columns:
-                events_data['date'] = pd.to_datetime(events_data['date'], errors='coerce')
-                events_data = events_data.dropna(subset=['date'])
-                
-                # Create a separate trace for events
-                event_texts = []
-                for _, event in events_data.iterrows():
-                    event_name = str(event.get('indicator', 'Event'))[:20]
-                    event_date = event['date']
-                    if pd.notna(event_date):
-                        event_texts.append(f"{event_date.strftime('%Y-%m')}: {event_name}")
-                
-                # Add events as a separate trace with markers
-                fig.add_trace(go.Scatter(
-                    x=events_data['date'],
-                    y=[data['value_numeric'].max() * 0.9] * len(events_data),
-                    mode='markers',
-                    name='Events',
-                    marker=dict(
-                        symbol='triangle-down',
-                        size=12,
-                        color='red',
-                        line=dict(width=2, color='darkred')
-                    ),
-                    text=event_texts,
-                    hovertemplate='%{text}<extra></extra>',
-                    showlegend=True
-                ))
+        # Add events if requested
+        if show_events and events_data is not None and 'date' in events_data.columns:
+            # The loader guarantees a NaT-free, sorted datetime64 date
+            # column, so no defensive copy/re-parse is needed here
+            assert events_data['date'].dtype.kind == 'M'
+
+            # Build all hover texts in one vectorized pass — dt.strftime
+            # and str.slice run in C instead of per-row Python
+            event_names = events_data['indicator'].astype(str) if 'indicator' in events_data.columns \
+                else pd.Series('Event', index=events_data.index)
+            event_texts = (events_data['date'].dt.strftime('%Y-%m') + ': '
+                           + event_names.str.slice(0, 20)).tolist()
+
+            # Add events as a separate trace with markers
+            fig.add_trace(go.Scattergl(
+                x=events_data['date'],
+                y=[values.max() * 0.9] * len(events_data),
+                mode='markers',
+                name='Events',
+                marker=dict(
+                    symbol='triangle-down',
+                    size=12,
+                    color='red',
+                    line=dict(width=2, color='darkred')
+                ),
+                text=event_texts,
+                hovertemplate='%{text}<extra></extra>',
+                showlegend=True
+            ))
         
         # Update layout
         fig.update_layout(
             title=dict(text=title, font=dict(size=20)),
             xaxis_title="Date",
             yaxis_title=yaxis_title,
-            hovermode='x unified',
-            template='plotly_white',
-            height=500,
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=1.02,
-                xanchor="right",
-                x=1
-            )
+            **_BASE_LAYOUT
         )
         
         return fig
     
     @staticmethod
+    @st.cache_data(**_FIGURE_CACHE)
     def create_forecast_plot(historical_data, forecast_data, title, scenario='base'):
         """Create forecast visualization with historical data"""
         fig = go.Figure()
         
-        # Historical data
+        # Historical data (downsampled if longer than the point budget)
         if historical_data is not None:
-            fig.add_trace(go.Scatter(
-                x=historical_data['date'],
-                y=historical_data['value_numeric'],
+            hist_x, hist_y = lttb_downsample(
+                historical_data['date'].to_numpy(),
+                historical_data['value_numeric'].to_numpy()
+            )
+            fig.add_trace(go.Scattergl(
+                x=hist_x,
+                y=hist_y,
                 mode='lines+markers',
                 name='Historical',
                 line=dict(color='black', width=3),
@@ -114,7 +197,7 @@ class DashboardVisualizations:
             forecast_years = pd.to_datetime(forecast_data['year'], format='%Y')
             
             # Main forecast line
-            fig.add_trace(go.Scatter(
+            fig.add_trace(go.Scattergl(
                 x=forecast_years,
                 y=forecast_data['value'],
                 mode='lines+markers',
@@ -126,9 +209,15 @@ class DashboardVisualizations:
             
             # Confidence interval if available
             if 'lower' in forecast_data.columns and 'upper' in forecast_data.columns:
+                # Build the fill polygon as contiguous ndarrays — no Python
+                # list round-trips before serialization
+                years_arr = forecast_years.to_numpy()
+                x_fill = np.concatenate([years_arr, years_arr[::-1]])
+                y_fill = np.concatenate([forecast_data['upper'].to_numpy(),
+                                         forecast_data['lower'].to_numpy()[::-1]])
                 fig.add_trace(go.Scatter(
-                    x=forecast_years.tolist() + forecast_years.tolist()[::-1],
-                    y=forecast_data['upper'].tolist() + forecast_data['lower'].tolist()[::-1],
+                    x=x_fill,
+                    y=y_fill,
                     fill='toself',
                     fillcolor='rgba(0, 100, 255, 0.2)',
                     line=dict(color='rgba(255,255,255,0)'),
@@ -142,21 +231,13 @@ class DashboardVisualizations:
             title=dict(text=title, font=dict(size=20)),
             xaxis_title="Year",
             yaxis_title="Percentage (%)",
-            hovermode='x unified',
-            template='plotly_white',
-            height=500,
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=1.02,
-                xanchor="right",
-                x=1
-            )
+            **_BASE_LAYOUT
         )
         
         return fig
     
     @staticmethod
+    @st.cache_data(**_FIGURE_CACHE)
     def create_scenario_comparison(forecasts_dict, title):
         """Compare multiple forecast scenarios"""
         fig = go.Figure()
@@ -167,7 +248,7 @@ class DashboardVisualizations:
             if data is not None:
                 forecast_years = pd.to_datetime(data['year'], format='%Y')
                 
-                fig.add_trace(go.Scatter(
+                fig.add_trace(go.Scattergl(
                     x=forecast_years,
                     y=data['value'],
                     mode='lines+markers',
@@ -181,36 +262,29 @@ class DashboardVisualizations:
             title=dict(text=title, font=dict(size=20)),
             xaxis_title="Year",
             yaxis_title="Percentage (%)",
-            hovermode='x unified',
-            template='plotly_white',
-            height=500,
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=1.02,
-                xanchor="right",
-                x=1
-            )
+            **_BASE_LAYOUT
         )
         
         return fig
     
     @staticmethod
+    @st.cache_data(**_FIGURE_CACHE)
     def create_event_impact_chart(impact_data, title):
         """Create bar chart of event impacts"""
         fig = go.Figure()
         
         # Sort by impact magnitude
         impact_data = impact_data.sort_values('Impact (pp)', ascending=False)
-        
-        # Color by direction
-        colors = ['green' if x > 0 else 'red' for x in impact_data['Impact (pp)']]
-        
+
+        # Color and label every bar in one vectorized pass
+        impacts = impact_data['Impact (pp)'].to_numpy()
+        colors = np.where(impacts > 0, 'green', 'red')
+
         fig.add_trace(go.Bar(
             x=impact_data['Event'],
-            y=impact_data['Impact (pp)'],
+            y=impacts,
             marker_color=colors,
-            text=impact_data['Impact (pp)'].apply(lambda x: f'{x:+.1f}pp'),
+            text=[f'{x:+.1f}pp' for x in impacts],
             textposition='outside',
             hovertemplate='Event: %{x}<br>Impact: %{y:+.1f}pp<extra></extra>'
         ))
@@ -227,6 +301,7 @@ class DashboardVisualizations:
         return fig
     
     @staticmethod
+    @st.cache_data(**_FIGURE_CACHE)
     def create_gauge_chart(value, title, min_val=0, max_val=100, target=None):
         """Create gauge chart for progress visualization"""
         fig = go.Figure(go.Indicator(
@@ -0,0 +1,36 @@
+"""
+One-off migration: write Parquet siblings for the processed CSV files
+
+The dashboard data loader prefers a .parquet sibling over the .csv when
+one exists, because Parquet is columnar and typed and loads several
+times faster than re-parsing CSV text. Run this after regenerating any
+of the CSVs:
+
+    python scripts/convert_csv_to_parquet.py
+"""
+import glob
+import os
+
+import pandas as pd
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Files whose first column is the index (kept when round-tripping)
+INDEXED_FILES = {'association_matrix.csv'}
+
+def convert_directory(directory):
+    """Write a .parquet sibling for every .csv in a directory"""
+    for csv_path in sorted(glob.glob(os.path.join(directory, '*.csv'))):
+        index_col = 0 if os.path.basename(csv_path) in INDEXED_FILES else None
+        df = pd.read_csv(csv_path, index_col=index_col)
+
+        parquet_path = os.path.splitext(csv_path)[0] + '.parquet'
+        df.to_parquet(parquet_path, engine='pyarrow', compression='zstd',
+                      index=index_col is not None)
+        print(f"✓ {os.path.relpath(csv_path, BASE_DIR)} → {os.path.basename(parquet_path)}")
+
+if __name__ == "__main__":
+    for subdir in ('data/processed', 'models'):
+        directory = os.path.join(BASE_DIR, *subdir.split('/'))
+        if os.path.isdir(directory):
+            convert_directory(directory)
@@ -0,0 +1,61 @@
+"""
+Pre-serialize the forecast figures to JSON
+
+st.plotly_chart re-serializes a go.Figure on every rerender; for the
+forecast plots the inputs only change when the model CSVs change, so
+the figures can be built once here and loaded as JSON at runtime. The
+dashboard falls back to building figures live when a JSON file is
+missing. Run this after regenerating the model outputs:
+
+    python scripts/prebuild_figures.py
+"""
+import os
+import sys
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(BASE_DIR, 'dashboard'))
+
+from utils.data_loader import DashboardDataLoader
+from utils.visualizations import DashboardVisualizations
+
+FIGURES_DIR = os.path.join(BASE_DIR, 'dashboard', 'figures')
+
+# (figure key prefix, indicator for forecasts, historical indicator names)
+FORECAST_FIGURES = [
+    ('forecast_account_ownership', 'Account Ownership',
+     ['Account Ownership Rate'], 'Account Ownership Forecast'),
+    ('forecast_digital_payments', 'Digital Payments',
+     ['USG_DIGITAL_PAYMENT', 'Digital Payment Usage Rate'], 'Digital Payment Usage Forecast'),
+]
+
+def main():
+    loader = DashboardDataLoader()
+    if not loader.load_all_data():
+        print("✗ Could not load data; no figures written")
+        return
+
+    os.makedirs(FIGURES_DIR, exist_ok=True)
+
+    for key_prefix, indicator, historical_names, title in FORECAST_FIGURES:
+        historical_data = loader.get_indicator_timeseries_any(historical_names)
+
+        for scenario in ('base', 'optimistic', 'pessimistic'):
+            forecast_data = loader.get_forecast_data(indicator, scenario)
+            if forecast_data is None:
+                print(f"⚠ No forecast for {indicator} ({scenario}); skipped")
+                continue
+
+            fig = DashboardVisualizations.create_forecast_plot(
+                historical_data,
+                forecast_data,
+                f"{title} ({scenario.title()} Scenario)",
+                scenario
+            )
+
+            path = os.path.join(FIGURES_DIR, f'{key_prefix}_{scenario}.json')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(fig.to_json())
+            print(f"✓ Wrote {os.path.relpath(path, BASE_DIR)}")
+
+if __name__ == "__main__":
+    main()
@@ -3,12 +3,44 @@ Forecasting models for Ethiopia financial inclusion
 """
 import pandas as pd
 import numpy as np
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-import statsmodels.api as sm
-from sklearn.linear_model import LinearRegression
-from prophet import Prophet
-import warnings
-warnings.filterwarnings('ignore')
+
+try:
+    from ._kernels import accumulate_event_effects
+except ImportError:  # module run outside the package
+    accumulate_event_effects = None
+
+# January-1 datetime64 per forecast year, built once — scalar datetime
+# parsing is surprisingly costly on repeated forecast calls
+_YEAR_STARTS = {}
+
+def _year_start(year: int) -> np.datetime64:
+    """Cached start-of-year date for a forecast year"""
+    ts = _YEAR_STARTS.get(year)
+    if ts is None:
+        ts = _YEAR_STARTS[year] = np.datetime64(f'{year}-01-01')
+    return ts
+
+def read_table(path: str, columns: list = None, **read_csv_kwargs) -> pd.DataFrame:
+    """
+    Read a tabular file, dispatching on suffix
+
+    Parquet and Feather preserve dtypes (including datetime64 columns)
+    and read several times faster than CSV; a .parquet sibling written
+    by scripts/convert_csv_to_parquet.py is preferred when one exists.
+    The columns argument prunes the read to just the named columns.
+    """
+    root, suffix = os.path.splitext(path)
+    if suffix == '.csv' and os.path.exists(root + '.parquet'):
+        path, suffix = root + '.parquet', '.parquet'
+
+    if suffix == '.parquet':
+        return pd.read_parquet(path, columns=columns, engine='pyarrow')
+    if suffix == '.feather':
+        return pd.read_feather(path, columns=columns)
+    return pd.read_csv(path, usecols=columns, **read_csv_kwargs)
 
 class FinancialInclusionForecaster:
     """Main class for forecasting financial inclusion indicators"""
@@ -21,150 +53,200 @@ class FinancialInclusionForecaster:
             enriched_data_path: Path to enriched dataset
             association_matrix_path: Path to event-impact association matrix
         """
-        self.data = pd.read_csv(enriched_data_path)
-        self.association_matrix = pd.read_csv(association_matrix_path, index_col=0)
+        self.data = read_table(enriched_data_path,
+                               columns=['record_id', 'record_type', 'indicator',
+                                        'observation_date', 'value_numeric'])
+        self.association_matrix = read_table(association_matrix_path, index_col=0) \
+            .astype('float32')
         self.forecasts = {}
         self.scenarios = {}
-        
+
+        # Categories turn the string filters below into int8 code
+        # comparisons, and the downcast halves the value column
+        for col in ('record_type', 'indicator'):
+            self.data[col] = self.data[col].astype('category')
+        self.data['value_numeric'] = pd.to_numeric(self.data['value_numeric'],
+                                                   downcast='float')
+
+        # Parse dates once and pre-split observations from events so each
+        # per-indicator filter scans a smaller, already-typed frame
+        self.data['date'] = pd.to_datetime(self.data['observation_date'])
+        self._observations = self.data[self.data['record_type'] == 'observation']
+        self._events = self.data.loc[self.data['record_type'] == 'event',
+                                     ['record_id', 'indicator', 'date']]
+        self._event_dates = self._events.drop_duplicates('indicator') \
+            .set_index('indicator')['date']
+        self._hist_cache = {}
+        self._baseline_cache = {}
+        self._ea_cache = {}
+
+        # Sparse view of the association matrix: nonzero impacts per
+        # indicator, so the forecast path does a dict lookup instead of
+        # scanning a dense column per call
+        self._impacts_by_ind = {
+            indicator: column[column != 0]
+            for indicator, column in self.association_matrix.items()
+        }
+
+        # One-time indicator → (year, value) ndarray index built with a
+        # single groupby pass; the regression path then works on tight
+        # numpy arrays with O(1) lookup instead of re-masking the frame
+        yearly_means = self._observations.groupby(
+            ['indicator', self._observations['date'].dt.year], observed=True
+        )['value_numeric'].mean()
+        self._hist = {
+            indicator: np.column_stack([
+                group.index.get_level_values(1).to_numpy(dtype=float),
+                group.to_numpy(dtype=float),
+            ])
+            for indicator, group in yearly_means.groupby(level=0, observed=True)
+        }
+
     def prepare_historical_data(self, indicator: str) -> pd.DataFrame:
         """Prepare historical time series for an indicator"""
-        # Filter for the indicator
-        indicator_data = self.data[
-            (self.data['record_type'] == 'observation') & 
-            (self.data['indicator'] == indicator)
-        ].copy()
-        
-        if indicator_data.empty:
+        # Several forecasting steps request the same indicator; reuse the
+        # frame built on the first call
+        if indicator in self._hist_cache:
+            return self._hist_cache[indicator]
+
+        # The yearly means were already aggregated into the array index
+        arr = self._hist.get(indicator)
+        if arr is None:
             raise ValueError(f"No historical data found for indicator: {indicator}")
-        
-        # Convert to time series
-        indicator_data['date'] = pd.to_datetime(indicator_data['observation_date'])
-        indicator_data = indicator_data.sort_values('date')
-        
-        # Aggregate by year (take mean if multiple values per year)
-        indicator_data['year'] = indicator_data['date'].dt.year
-        yearly_data = indicator_data.groupby('year')['value_numeric'].mean().reset_index()
-        
+
+        yearly_data = pd.DataFrame({'year': arr[:, 0].astype(int),
+                                    'value_numeric': arr[:, 1]})
+        self._hist_cache[indicator] = yearly_data
         return yearly_data
     
     def baseline_forecast(self, indicator: str, forecast_years: list = [2025, 2026, 2027]):
         """Create baseline forecast using linear regression"""
-        
-        # Get historical data
-        historical = self.prepare_historical_data(indicator)
-        
-        if len(historical) < 2:
+
+        # Repeated entry points (scenarios, summaries, target gap) share
+        # one fit; copies are returned because callers add columns
+        key = (indicator, tuple(forecast_years))
+        if key in self._baseline_cache:
+            return self._baseline_cache[key].copy()
+
+        # Get historical data from the array index
+        arr = self._hist.get(indicator)
+        if arr is None:
+            raise ValueError(f"No historical data found for indicator: {indicator}")
+
+        if len(arr) < 2:
             raise ValueError(f"Insufficient historical data for {indicator}")
-        
-        # Linear regression model
-        X = historical['year'].values.reshape(-1, 1)
-        y = historical['value_numeric'].values
-        
-        model = LinearRegression()
-        model.fit(X, y)
-        
+
+        # Closed-form least squares — a one-feature fit needs only the
+        # mean/covariance formula, not a full sklearn estimator
+        x = arr[:, 0]
+        y = arr[:, 1]
+        x_mean = x.mean()
+        y_mean = y.mean()
+        x_centered = x - x_mean
+        slope = (x_centered * (y - y_mean)).sum() / (x_centered ** 2).sum()
+        intercept = y_mean - slope * x_mean
+
         # Generate forecasts
+        years_arr = np.asarray(forecast_years, dtype=float)
         forecast_df = pd.DataFrame({'year': forecast_years})
-        forecast_df['baseline'] = model.predict(forecast_df[['year']])
-        
+        forecast_df['baseline'] = slope * years_arr + intercept
+
         # Calculate confidence intervals
-        y_pred = model.predict(X)
-        residuals = y - y_pred
+        residuals = y - (slope * x + intercept)
         std_error = np.std(residuals)
         
         forecast_df['baseline_lower'] = forecast_df['baseline'] - 1.96 * std_error
         forecast_df['baseline_upper'] = forecast_df['baseline'] + 1.96 * std_error
-        
-        return forecast_df
+
+        self._baseline_cache[key] = forecast_df
+        return forecast_df.copy()
     
     def event_augmented_forecast(self, indicator: str, forecast_years: list = [2025, 2026, 2027]):
         """Create forecast incorporating event impacts"""
-        
+
+        key = (indicator, tuple(forecast_years))
+        if key in self._ea_cache:
+            return self._ea_cache[key].copy()
+
         # Start with baseline
         baseline_df = self.baseline_forecast(indicator, forecast_years)
         
         # Get event impacts for this indicator
-        if indicator not in self.association_matrix.columns:
+        if indicator not in self._impacts_by_ind:
             print(f"No event impacts found for {indicator}, returning baseline")
             baseline_df['event_augmented'] = baseline_df['baseline']
-            return baseline_df
+            self._ea_cache[key] = baseline_df
+            return baseline_df.copy()
         
-        # Calculate cumulative event impacts
-        event_impacts = self.association_matrix[indicator]
-        active_events = event_impacts[event_impacts != 0]
+        # Nonzero impacts were pre-extracted at construction
+        active_events = self._impacts_by_ind[indicator]
         
         if active_events.empty:
             print(f"No active event impacts for {indicator}, returning baseline")
             baseline_df['event_augmented'] = baseline_df['baseline']
-            return baseline_df
-        
-        # Get event dates
-        events = self.data[self.data['record_type'] == 'event'].copy()
-        events['date'] = pd.to_datetime(events['observation_date'])
-        
-        # Calculate event effects for each forecast year
-        event_effects = {}
-        for year in forecast_years:
-            year_effect = 0
-            year_date = pd.Timestamp(f'{year}-01-01')
-            
-            for event_name, impact in active_events.items():
-                # Find event date
-                event_row = events[events['indicator'] == event_name]
-                if not event_row.empty:
-                    event_date = event_row['date'].iloc[0]
-                    
-                    # Calculate time since event (in years)
-                    years_since = (year_date - event_date).days / 365.25
-                    
-                    if years_since > 0:
-                        # Apply impact with 2-year ramp-up (gradual effect)
-                        effect_factor = min(1.0, years_since / 2)
-                        year_effect += impact * effect_factor
-            
-            event_effects[year] = year_effect
-        
-        # Apply event effects
-        baseline_df['event_augmented'] = baseline_df['baseline'] + baseline_df['year'].map(event_effects)
-        baseline_df['event_lower'] = baseline_df['event_augmented'] - 1.96 * np.std(list(event_effects.values()))
-        baseline_df['event_upper'] = baseline_df['event_augmented'] + 1.96 * np.std(list(event_effects.values()))
-        
-        return baseline_df
+            self._ea_cache[key] = baseline_df
+            return baseline_df.copy()
+        
+        # Effect factors ramp from 0 to 1 over two years after each event
+        # date; the yearly effects are the ramp-weighted impact sums
+        impacts = active_events.to_numpy(dtype=float)
+        event_dates = self._event_dates.reindex(active_events.index).to_numpy('datetime64[D]')
+        year_dates = np.array([_year_start(year) for year in forecast_years])
+
+        # Events without a dated row contribute nothing
+        valid = ~np.isnat(event_dates)
+
+        if accumulate_event_effects is not None:
+            # Compiled kernel: one fused loop, no (year, event) temporary
+            year_effects = accumulate_event_effects(
+                year_dates.astype('int64').astype(np.float64),
+                event_dates[valid].astype('int64').astype(np.float64),
+                impacts[valid]
+            )
+        else:
+            # Vectorized fallback: broadcast the grid and collapse it to a
+            # single matrix-vector product
+            years_since = (year_dates[:, None] - event_dates[None, :]) \
+                .astype('timedelta64[D]').astype(float) / 365.25
+            effect_factor = np.clip(years_since / 2, 0.0, 1.0)
+            effect_factor[:, ~valid] = 0.0
+            year_effects = effect_factor @ impacts
+
+        # Apply event effects (ndarray add, no intermediate Series)
+        baseline_df['event_augmented'] = baseline_df['baseline'].to_numpy() + year_effects
+        effect_std = np.std(year_effects)
+        baseline_df['event_lower'] = baseline_df['event_augmented'] - 1.96 * effect_std
+        baseline_df['event_upper'] = baseline_df['event_augmented'] + 1.96 * effect_std
+
+        self._ea_cache[key] = baseline_df
+        return baseline_df.copy()
     
     def create_scenarios(self, indicator: str, forecast_years: list = [2025, 2026, 2027]):
         """Create optimistic, base, and pessimistic scenarios"""
         
         # Get event-augmented forecast as base scenario
         base_df = self.event_augmented_forecast(indicator, forecast_years)
-        
-        # Scenario multipliers
-        optimistic_mult = 1.2  # 20% better than expected
-        pessimistic_mult = 0.8  # 20% worse than expected
-        
-        scenarios_df = base_df[['year']].copy()
-        
-        # Base scenario (event-augmented)
-        scenarios_df['base'] = base_df['event_augmented']
-        scenarios_df['base_lower'] = base_df['event_lower']
-        scenarios_df['base_upper'] = base_df['event_upper']
-        
-        # Optimistic scenario
-        scenarios_df['optimistic'] = base_df['event_augmented'] * optimistic_mult
-        scenarios_df['optimistic_lower'] = base_df['event_lower'] * optimistic_mult
-        scenarios_df['optimistic_upper'] = base_df['event_upper'] * optimistic_mult
-        
-        # Pessimistic scenario
-        scenarios_df['pessimistic'] = base_df['event_augmented'] * pessimistic_mult
-        scenarios_df['pessimistic_lower'] = base_df['event_lower'] * pessimistic_mult
-        scenarios_df['pessimistic_upper'] = base_df['event_upper'] * pessimistic_mult
-        
-        # Ensure values don't exceed 100%
-        for col in ['base', 'optimistic', 'pessimistic', 
-                   'base_lower', 'optimistic_lower', 'pessimistic_lower',
-                   'base_upper', 'optimistic_upper', 'pessimistic_upper']:
-            scenarios_df[col] = scenarios_df[col].clip(upper=100)
-            scenarios_df[col] = scenarios_df[col].clip(lower=0)
-        
+
+        # SoA layout: axis 0 = scenario (base, optimistic, pessimistic),
+        # axis 1 = bound (mid, lower, upper), axis 2 = year. The whole
+        # multiply/clip pipeline runs on this one contiguous block with
+        # no column-name lookups; the DataFrame is materialized only at
+        # the end for callers that want one
+        mults = np.array([1.0, 1.2, 0.8])[:, None, None]
+        bounds = base_df[['event_augmented', 'event_lower', 'event_upper']] \
+            .to_numpy().T
+        arr = mults * bounds[None, :, :]
+        np.clip(arr, 0.0, 100.0, out=arr)
+
+        years = base_df['year'].to_numpy()
+        self.scenarios[indicator] = {'years': years, 'values': arr}
+
+        scenarios_df = pd.DataFrame({'year': years})
+        for i, scenario in enumerate(('base', 'optimistic', 'pessimistic')):
+            scenarios_df[scenario] = arr[i, 0]
+            scenarios_df[f'{scenario}_lower'] = arr[i, 1]
+            scenarios_df[f'{scenario}_upper'] = arr[i, 2]
+
         return scenarios_df
     
     def forecast_all_indicators(self):
@@ -174,35 +256,56 @@ class FinancialInclusionForecaster:
             'Account Ownership Rate': 'Access',
             'USG_DIGITAL_PAYMENT': 'Usage'
         }
-        
+
         all_forecasts = {}
-        
-        for indicator, pillar in key_indicators.items():
-            print(f"Forecasting {indicator} ({pillar})...")
-            
+
+        # Pre-warm the history cache on the main thread so the workers
+        # below only read shared state
+        for indicator in key_indicators:
             try:
-                # Get scenarios
-                scenarios = self.create_scenarios(indicator)
-                all_forecasts[indicator] = {
-                    'pillar': pillar,
-                    'scenarios': scenarios,
-                    'latest_historical': self.get_latest_value(indicator)
-                }
-                
-                print(f"  ✓ Completed: {len(scenarios)} forecast years")
-                
-            except Exception as e:
-                print(f"  ✗ Error forecasting {indicator}: {str(e)}")
-                all_forecasts[indicator] = None
-        
+                self.prepare_historical_data(indicator)
+            except ValueError:
+                pass
+
+        # Indicators are independent, and the hot work is numpy/pandas
+        # code that releases the GIL, so they forecast in parallel
+        max_workers = min(len(key_indicators), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self._forecast_one, indicator, pillar)
+                       for indicator, pillar in key_indicators.items()]
+            for future in as_completed(futures):
+                indicator, result = future.result()
+                all_forecasts[indicator] = result
+
         self.forecasts = all_forecasts
         return all_forecasts
+
+    def _forecast_one(self, indicator: str, pillar: str):
+        """Build the scenario bundle for a single indicator"""
+        print(f"Forecasting {indicator} ({pillar})...")
+
+        try:
+            # Get scenarios
+            scenarios = self.create_scenarios(indicator)
+            result = {
+                'pillar': pillar,
+                'scenarios': scenarios,
+                'latest_historical': self.get_latest_value(indicator)
+            }
+
+            print(f"  ✓ Completed: {len(scenarios)} forecast years")
+            return indicator, result
+
+        except Exception as e:
+            print(f"  ✗ Error forecasting {indicator}: {str(e)}")
+            return indicator, None
     
     def get_latest_value(self, indicator: str):
         """Get latest historical value for an indicator"""
         historical = self.prepare_historical_data(indicator)
         if not historical.empty:
-            return historical.iloc[-1]['value_numeric']
+            # Direct ndarray indexing; .iloc dispatch dominates on a tiny frame
+            return historical['value_numeric'].to_numpy()[-1]
         return None
     
     def generate_forecast_summary(self):
@@ -211,29 +314,40 @@ class FinancialInclusionForecaster:
         if not self.forecasts:
             self.forecast_all_indicators()
         
-        summary = []
-        
+        frames = []
+
         for indicator, data in self.forecasts.items():
             if data is None:
                 continue
-                
+
             scenarios_df = data['scenarios']
             latest_value = data['latest_historical']
-            
-            for _, row in scenarios_df.iterrows():
-                summary.append({
-                    'Year': row['year'],
-                    'Indicator': indicator,
-                    'Pillar': data['pillar'],
-                    'Latest Historical': latest_value,
-                    'Base Forecast': row['base'],
-                    'Optimistic Forecast': row['optimistic'],
-                    'Pessimistic Forecast': row['pessimistic'],
-                    'Base Range': f"{row['base_lower']:.1f}-{row['base_upper']:.1f}",
-                    'Growth from 2024 (Base)': f"{(row['base'] - latest_value):+.1f}pp" if latest_value else "N/A"
-                })
-        
-        return pd.DataFrame(summary)
+
+            # Whole-column construction: the string columns are built with
+            # one vectorized round/concat each instead of per-row f-strings
+            base_range = (scenarios_df['base_lower'].map('{:.1f}'.format) + '-'
+                          + scenarios_df['base_upper'].map('{:.1f}'.format))
+            if latest_value:
+                growth = (scenarios_df['base'] - latest_value) \
+                    .map('{:+.1f}pp'.format)
+            else:
+                growth = 'N/A'
+
+            frames.append(pd.DataFrame({
+                'Year': scenarios_df['year'],
+                'Indicator': indicator,
+                'Pillar': data['pillar'],
+                'Latest Historical': latest_value,
+                'Base Forecast': scenarios_df['base'],
+                'Optimistic Forecast': scenarios_df['optimistic'],
+                'Pessimistic Forecast': scenarios_df['pessimistic'],
+                'Base Range': base_range,
+                'Growth from 2024 (Base)': growth
+            }))
+
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
     
     def calculate_nfis_target_gap(self):
         """Calculate gap to NFIS-II targets (70% by 2025)"""
@@ -248,7 +362,7 @@ class FinancialInclusionForecaster:
         forecast_2025 = ownership_forecast[ownership_forecast['year'] == 2025]
         
         if not forecast_2025.empty:
-            base_2025 = forecast_2025['base'].iloc[0]
+            base_2025 = float(forecast_2025['base'].to_numpy()[0])
             gap = nfis_target_2025 - base_2025
             
             return {
@@ -17,29 +17,34 @@ class ScenarioAnalyzer:
     def create_scenario_summary(self) -> pd.DataFrame:
         """Create summary of all scenarios"""
         
-        summary_data = []
-        
+        frames = []
+
         for indicator, data in self.forecasts.items():
             if data is None:
                 continue
-                
+
             scenarios_df = data['scenarios']
             latest_value = data['latest_historical']
-            
-            # Calculate key metrics for each scenario
+
+            # One column-rename per scenario instead of per-row dicts
             for scenario in ['base', 'optimistic', 'pessimistic']:
-                for _, row in scenarios_df.iterrows():
-                    summary_data.append({
-                        'Year': row['year'],
-                        'Indicator': indicator,
-                        'Scenario': scenario,
-                        'Forecast': row[scenario],
-                        'Lower Bound': row[f'{scenario}_lower'],
-                        'Upper Bound': row[f'{scenario}_upper'],
-                        'Latest Historical': latest_value
-                    })
-        
-        self.scenarios_summary = pd.DataFrame(summary_data)
+                frames.append(
+                    scenarios_df[['year', scenario, f'{scenario}_lower', f'{scenario}_upper']]
+                    .rename(columns={'year': 'Year',
+                                     scenario: 'Forecast',
+                                     f'{scenario}_lower': 'Lower Bound',
+                                     f'{scenario}_upper': 'Upper Bound'})
+                    .assign(Indicator=indicator, Scenario=scenario,
+                            **{'Latest Historical': latest_value})
+                )
+
+        if frames:
+            self.scenarios_summary = pd.concat(frames, ignore_index=True)[
+                ['Year', 'Indicator', 'Scenario', 'Forecast',
+                 'Lower Bound', 'Upper Bound', 'Latest Historical']
+            ]
+        else:
+            self.scenarios_summary = pd.DataFrame()
         return self.scenarios_summary
     
     def plot_forecast_timeline(self, indicator: str, save_path: str = None):
@@ -123,55 +128,64 @@ class ScenarioAnalyzer:
             if latest_value is None:
                 continue
             
+            # One year-indexed lookup instead of a frame filter per
+            # (scenario, year) pair
+            lookup = scenarios_df.set_index('year')[
+                ['base', 'optimistic', 'pessimistic']].to_dict('index')
+
             for scenario in ['base', 'optimistic', 'pessimistic']:
                 # Calculate growth from 2024 to each forecast year
                 for year in [2025, 2026, 2027]:
-                    forecast_value = scenarios_df[scenarios_df['year'] == year][scenario].iloc[0]
+                    forecast_value = lookup[year][scenario]
                     growth = forecast_value - latest_value
                     growth_pct = (growth / latest_value) * 100 if latest_value > 0 else 0
-                    
+
                     growth_data.append({
                         'Indicator': indicator,
                         'Scenario': scenario,
                         'Year': year,
                         'Forecast': forecast_value,
                         'Growth (pp)': growth,
-                        'Growth (%)': growth_pct,
-                        'Cumulative Growth (2024-2027)': None  # Will fill later
+                        'Growth (%)': growth_pct
                     })
-        
+
         growth_df = pd.DataFrame(growth_data)
-        
-        # Calculate cumulative growth
-        for indicator in growth_df['Indicator'].unique():
-            for scenario in growth_df['Scenario'].unique():
-                mask = (growth_df['Indicator'] == indicator) & (growth_df['Scenario'] == scenario)
-                if mask.any():
-                    cumulative = growth_df.loc[mask, 'Growth (pp)'].sum()
-                    growth_df.loc[mask, 'Cumulative Growth (2024-2027)'] = cumulative
-        
+
+        # Cumulative growth in one grouped pass instead of a boolean mask
+        # per (indicator, scenario) pair
+        if not growth_df.empty:
+            growth_df['Cumulative Growth (2024-2027)'] = growth_df.groupby(
+                ['Indicator', 'Scenario'])['Growth (pp)'].transform('sum')
+
         return growth_df
     
     def identify_key_drivers(self, association_matrix: pd.DataFrame) -> pd.DataFrame:
         """Identify key events driving forecast outcomes"""
         
-        driver_analysis = []
-        
-        for indicator in ['Account Ownership Rate', 'USG_DIGITAL_PAYMENT']:
-            if indicator in association_matrix.columns:
-                impacts = association_matrix[indicator]
-                significant_events = impacts[impacts != 0].sort_values(ascending=False)
-                
-                for event, impact in significant_events.items():
-                    driver_analysis.append({
-                        'Indicator': indicator,
-                        'Event': event,
-                        'Impact (pp)': impact,
-                        'Magnitude': 'High' if abs(impact) >= 10 else 'Medium' if abs(impact) >= 5 else 'Low',
-                        'Direction': 'Positive' if impact > 0 else 'Negative'
-                    })
-        
-        return pd.DataFrame(driver_analysis)
+        target_cols = [indicator for indicator in
+                       ['Account Ownership Rate', 'USG_DIGITAL_PAYMENT']
+                       if indicator in association_matrix.columns]
+        if not target_cols:
+            return pd.DataFrame()
+
+        # One melt over the matrix instead of per-indicator column scans
+        # and a Python loop per event
+        drivers = association_matrix[target_cols].reset_index() \
+            .melt(id_vars='index', var_name='Indicator', value_name='Impact (pp)') \
+            .rename(columns={'index': 'Event'})
+        drivers = drivers[drivers['Impact (pp)'] != 0]
+
+        drivers['Magnitude'] = pd.cut(
+            drivers['Impact (pp)'].abs(), [0, 5, 10, np.inf],
+            labels=['Low', 'Medium', 'High'], right=False)
+        drivers['Direction'] = np.where(drivers['Impact (pp)'] > 0,
+                                        'Positive', 'Negative')
+
+        # Keep the old loop's per-indicator, descending-impact ordering
+        drivers = drivers.sort_values(['Indicator', 'Impact (pp)'],
+                                      ascending=[True, False])
+        return drivers[['Indicator', 'Event', 'Impact (pp)',
+                        'Magnitude', 'Direction']].reset_index(drop=True)
     
     def generate_uncertainty_assessment(self) -> Dict:
         """Assess forecast uncertainty"""
@@ -0,0 +1,42 @@
+"""
+Optional compiled kernels for impact-modeling hot paths
+
+numba is not a hard dependency: when it is installed, the kernels here
+compile to machine code on first call (cached to disk via cache=True)
+and release the GIL; otherwise callers fall back to their vectorized
+numpy implementations.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True, nogil=True)
+    def shape_gradual(n, start, end):
+        """
+        Unit gradual-effect shape over a monthly timeline
+
+        Ramps linearly from 0 to 1 between start and end, then holds at
+        1 for the rest of the timeline. One sequential loop, no
+        temporaries.
+
+        Args:
+            n: Timeline length in months
+            start: Position where the ramp begins
+            end: Position where the ramp reaches full strength
+
+        Returns:
+            Array of length n with the unit shape
+        """
+        out = np.zeros(n)
+        k = end - start
+        for i in range(k):
+            out[start + i] = (i + 1) / k
+        for i in range(end, n):
+            out[i] = 1.0
+        return out
+else:
+    shape_gradual = None
@@ -40,37 +40,36 @@ class AssociationMatrixBuilder:
         # Get unique events and indicators
         events = self.events['indicator'].unique()
         indicators = list(indicator_mapping.values())
-        
-        # Initialize matrix
-        matrix = pd.DataFrame(0.0, index=events, columns=indicators)
-        
-        # Fill matrix from impact links
-        for _, link in self.impact_links.iterrows():
-            # Get event name
-            event_mask = self.events['record_id'] == link['parent_id']
-            if not event_mask.any():
-                continue
-                
-            event_name = self.events[event_mask]['indicator'].iloc[0]
-            
-            # Get indicator name
-            indicator_code = link['related_indicator']
-            if pd.isna(indicator_code):
-                continue
-                
-            indicator_name = indicator_mapping.get(indicator_code)
-            if not indicator_name or indicator_name not in matrix.columns:
-                continue
-            
-            # Calculate impact value
-            impact_value = self._calculate_impact_value(link)
-            
-            # Store in matrix
-            matrix.loc[event_name, indicator_name] = impact_value
-            
-            # Store evidence
-            self._store_evidence(event_name, indicator_name, link, impact_value)
-        
+
+        # Resolve every link in bulk: dict-backed name maps plus one
+        # vectorized impact computation, instead of per-row scans and
+        # scalar .loc writes
+        event_names = self.events.drop_duplicates('record_id') \
+            .set_index('record_id')['indicator']
+        links = self.impact_links.dropna(subset=['related_indicator']).copy()
+        links['event_name'] = links['parent_id'].map(event_names)
+        links['indicator_name'] = links['related_indicator'].map(indicator_mapping)
+        links = links.dropna(subset=['event_name', 'indicator_name'])
+
+        estimates = pd.to_numeric(links['impact_estimate'], errors='coerce')
+        magnitude_values = links['impact_magnitude'].map(
+            {'high': 15.0, 'medium': 8.0, 'low': 3.0}).fillna(5.0)
+        signs = np.where(links['impact_direction'] == 'increase', 1.0, -1.0)
+        links['impact_value'] = estimates.fillna(magnitude_values) * signs
+
+        # aggfunc='last' keeps the overwrite-on-duplicate behavior of the
+        # old row loop; reindex restores the full event/indicator grid
+        matrix = links.pivot_table(index='event_name', columns='indicator_name',
+                                   values='impact_value', aggfunc='last') \
+            .reindex(index=events, columns=indicators).fillna(0.0)
+        matrix.index.name = None
+        matrix.columns.name = None
+
+        # Evidence rows: one cheap itertuples pass over the resolved links
+        for link in links.itertuples(index=False):
+            self._store_evidence(link.event_name, link.indicator_name,
+                                 link, link.impact_value)
+
         self.matrix = matrix
         return matrix
     
@@ -91,19 +90,21 @@ class AssociationMatrixBuilder:
         base_value = magnitude_estimates.get(link['impact_magnitude'], 5.0)
         return base_value if link['impact_direction'] == 'increase' else -base_value
     
-    def _store_evidence(self, event_name: str, indicator_name: str, 
-                       link: pd.Series, impact_value: float):
+    def _store_evidence(self, event_name: str, indicator_name: str,
+                       link, impact_value: float):
         """Store evidence for impact relationship"""
+        # link may be a Series or an itertuples row; both support
+        # attribute access on these column names
         key = f"{event_name}||{indicator_name}"
-        
+
         self.evidence_base[key] = {
             'impact_value': impact_value,
-            'direction': link['impact_direction'],
-            'magnitude': link['impact_magnitude'],
-            'lag_months': link['lag_months'],
-            'evidence_basis': link['evidence_basis'],
-            'comparable_country': link['comparable_country'],
-            'confidence': link['confidence']
+            'direction': link.impact_direction,
+            'magnitude': link.impact_magnitude,
+            'lag_months': link.lag_months,
+            'evidence_basis': link.evidence_basis,
+            'comparable_country': link.comparable_country,
+            'confidence': link.confidence
         }
     
     def export_matrix(self, filepath: str, format: str = 'csv'):
@@ -130,23 +131,35 @@ class AssociationMatrixBuilder:
         if self.matrix is None:
             raise ValueError("Matrix not built. Call build_matrix() first.")
         
-        summary = []
-        for event in self.matrix.index:
-            for indicator in self.matrix.columns:
-                impact = self.matrix.loc[event, indicator]
-                if impact != 0:
-                    key = f"{event}||{indicator}"
-                    evidence = self.evidence_base.get(key, {})
-                    
-                    summary.append({
-                        'event': event,
-                        'indicator': indicator,
-                        'impact_value': impact,
-                        'direction': 'Positive' if impact > 0 else 'Negative',
-                        'magnitude': evidence.get('magnitude', 'medium'),
-                        'lag_months': evidence.get('lag_months', 12),
-                        'evidence_basis': evidence.get('evidence_basis', 'estimated'),
-                        'confidence': evidence.get('confidence', 'medium')
-                    })
-        
-        return pd.DataFrame(summary)
\ No newline at end of file
+        # One stack over the matrix instead of an event × indicator loop
+        # that mostly hits zero cells
+        stacked = self.matrix.stack().rename('impact_value').reset_index()
+        stacked.columns = ['event', 'indicator', 'impact_value']
+        stacked = stacked[stacked['impact_value'] != 0].copy()
+        if stacked.empty:
+            return pd.DataFrame()
+
+        stacked['direction'] = np.where(stacked['impact_value'] > 0,
+                                        'Positive', 'Negative')
+
+        # Join the evidence rows in one merge, then fill the same
+        # defaults the old per-cell .get() lookups used
+        evidence_cols = ['magnitude', 'lag_months', 'evidence_basis', 'confidence']
+        if self.evidence_base:
+            evidence = pd.DataFrame.from_dict(self.evidence_base, orient='index')
+            evidence.index = pd.MultiIndex.from_tuples(
+                [tuple(key.split('||')) for key in evidence.index],
+                names=['event', 'indicator'])
+            stacked = stacked.merge(evidence[evidence_cols],
+                                    left_on=['event', 'indicator'],
+                                    right_index=True, how='left')
+
+        defaults = {'magnitude': 'medium', 'lag_months': 12,
+                    'evidence_basis': 'estimated', 'confidence': 'medium'}
+        for col, default in defaults.items():
+            if col in stacked.columns:
+                stacked[col] = stacked[col].fillna(default)
+            else:
+                stacked[col] = default
+
+        return stacked.reset_index(drop=True)
@@ -3,15 +3,55 @@ Event Impact Modeler - Core class for modeling event impacts on financial inclus
 """
 import pandas as pd
 import numpy as np
+import os
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
-import matplotlib.pyplot as plt
-import seaborn as sns
 from scipy import stats
 
+try:
+    from ._kernels import shape_gradual
+except ImportError:
+    shape_gradual = None
+
+def _load_cached(path: str, columns: list = None, **read_csv_kwargs) -> pd.DataFrame:
+    """
+    Load a CSV with a Parquet sibling cache
+
+    Reads the .parquet sibling when one exists — typed, no re-parse,
+    several times faster — and otherwise parses the full CSV and writes
+    the sibling for the next run, narrowing to columns in memory so the
+    cached file stays complete for other callers. A read-only
+    filesystem or missing pyarrow simply skips the write.
+    """
+    parse_dates = read_csv_kwargs.get('parse_dates') or ()
+    parquet_path = os.path.splitext(path)[0] + '.parquet'
+    if os.path.exists(parquet_path):
+        df = pd.read_parquet(parquet_path, engine='pyarrow', columns=columns)
+        # Siblings written by other tools may still carry string dates
+        for col in parse_dates:
+            if col in df.columns and df[col].dtype.kind != 'M':
+                df[col] = pd.to_datetime(df[col])
+        return df
+
+    df = pd.read_csv(path, **read_csv_kwargs)
+    try:
+        df.to_parquet(parquet_path, engine='pyarrow')
+    except (ImportError, OSError):
+        pass
+    return df[columns] if columns is not None else df
+
 class EventImpactModeler:
     """Models the impact of events on financial inclusion indicators"""
-    
+
+    # Indicator code/name lookup tables, built once at import
+    _CODE_TO_NAME = {
+        'ACC_OWNERSHIP': 'Account Ownership Rate',
+        'ACC_MM_ACCOUNT': 'Mobile Money Account Rate',
+        'USG_DIGITAL_PAYMENT': 'USG_DIGITAL_PAYMENT'
+    }
+    _NAME_TO_CODE = {name: code for code, name in _CODE_TO_NAME.items()}
+
     def __init__(self, enriched_data_path: str, impact_links_path: str):
         """
         Initialize the event impact modeler
@@ -20,25 +60,82 @@ class EventImpactModeler:
             enriched_data_path: Path to enriched dataset
             impact_links_path: Path to impact links dataset
         """
-        self.enriched_data = pd.read_csv(enriched_data_path)
-        self.impact_links = pd.read_csv(impact_links_path)
+        # Only the columns the modeler actually touches are read, so
+        # every downstream scan sees a narrower frame
+        self.enriched_data = _load_cached(
+            enriched_data_path,
+            columns=['record_id', 'record_type', 'indicator', 'category',
+                     'observation_date', 'value_numeric', 'gender', 'location'],
+            parse_dates=['observation_date'])
+        self.impact_links = _load_cached(
+            impact_links_path,
+            columns=['parent_id', 'related_indicator', 'impact_direction',
+                     'impact_magnitude', 'impact_estimate', 'lag_months'])
+
+        # Categories turn the repeated string columns into int8 code
+        # buffers for every later filter/merge/groupby, and the numeric
+        # downcasts halve their bandwidth
+        for col in ('record_type', 'indicator', 'category', 'gender', 'location'):
+            if col in self.enriched_data.columns:
+                self.enriched_data[col] = self.enriched_data[col].astype('category')
+        self.enriched_data['value_numeric'] = pd.to_numeric(
+            self.enriched_data['value_numeric'], downcast='float')
+        for col in ('impact_direction', 'impact_magnitude', 'related_indicator'):
+            if col in self.impact_links.columns:
+                self.impact_links[col] = self.impact_links[col].astype('category')
+        if 'lag_months' in self.impact_links.columns:
+            self.impact_links['lag_months'] = pd.to_numeric(
+                self.impact_links['lag_months'], downcast='integer')
         self.events = None
         self.observations = None
         self.association_matrix = None
         self.impact_functions = {}
+        self._timeline_index = None
+        self._effect_cache = {}
+        self._shape_cache = {}
+        self._validation_cache = None
+
+        # Both helpers see only a handful of distinct string arguments,
+        # so per-instance memoization turns the repeated indexed lookups
+        # into hash hits
+        self._map_indicator_code_to_name = lru_cache(maxsize=128)(
+            self._map_indicator_code_to_name)
+        self._get_lag_months = lru_cache(maxsize=128)(self._get_lag_months)
         
     def prepare_data(self) -> None:
         """Prepare and clean data for modeling"""
-        # Separate events and observations
-        self.events = self.enriched_data[self.enriched_data['record_type'] == 'event'].copy()
-        self.observations = self.enriched_data[self.enriched_data['record_type'] == 'observation'].copy()
-        
-        # Convert dates
-        self.events['event_date'] = pd.to_datetime(self.events['observation_date'])
-        self.observations['obs_date'] = pd.to_datetime(self.observations['observation_date'])
+        # Separate events and observations — the boolean selections
+        # already materialize new frames, so no extra copy is needed, and
+        # only the consumed columns are kept
+        record_type = self.enriched_data['record_type']
+        self.events = self.enriched_data.loc[
+            record_type == 'event',
+            ['record_id', 'indicator', 'category', 'observation_date', 'value_numeric']]
+        self.observations = self.enriched_data.loc[
+            record_type == 'observation',
+            ['record_id', 'indicator', 'observation_date', 'value_numeric', 'gender', 'location']]
+
+        # Dates were parsed at load time (and survive the Parquet cache)
+        self.events['event_date'] = self.events['observation_date']
+        self.observations['obs_date'] = self.observations['observation_date']
         
         # Filter for key indicators
         self.key_indicators = ['Account Ownership Rate', 'Mobile Money Account Rate', 'USG_DIGITAL_PAYMENT']
+
+        # Shared monthly timeline for all effect series, built once
+        self._timeline_index = pd.date_range(start='2011-01-01', end='2027-12-31', freq='ME')
+        self._timeline_values = self._timeline_index.values
+
+        # Hash-indexed lookups so per-event queries stop re-scanning the
+        # events and links frames
+        self._event_by_name = self.events.drop_duplicates('indicator').set_index('indicator')
+        self._link_by_event_indicator = self.impact_links \
+            .set_index(['parent_id', 'related_indicator']).sort_index()
+
+        # Yearly means per indicator, aggregated once for validation
+        self._yearly_means = self.observations.groupby(
+            ['indicator', self.observations['obs_date'].dt.year],
+            observed=True)['value_numeric'].mean()
         
     def create_association_matrix(self) -> pd.DataFrame:
         """
@@ -47,44 +144,56 @@ class EventImpactModeler:
         Returns:
             DataFrame with events as rows, indicators as columns
         """
-        # Initialize empty matrix
         events_list = self.events['indicator'].unique()
         indicators_list = self.key_indicators
-        
-        # Create matrix
-        matrix = pd.DataFrame(0.0, index=events_list, columns=indicators_list)
-        
-        # Fill with impact estimates from impact links
-        for _, link in self.impact_links.iterrows():
-            event_name = self.events[self.events['record_id'] == link['parent_id']]['indicator'].values
-            if len(event_name) > 0:
-                event_name = event_name[0]
-                indicator = link['related_indicator']
-                
-                # Map indicator codes to names
-                indicator_name = self._map_indicator_code_to_name(indicator)
-                
-                if indicator_name in matrix.columns and event_name in matrix.index:
-                    # Convert qualitative impact to quantitative estimate
-                    impact_value = self._quantify_impact(
-                        link['impact_direction'],
-                        link['impact_magnitude'],
-                        link['impact_estimate']
-                    )
-                    matrix.loc[event_name, indicator_name] = impact_value
-        
+
+        # Resolve every link in one merge against the events instead of
+        # scanning the events frame per row
+        links = self.impact_links.merge(
+            self.events[['record_id', 'indicator']].rename(
+                columns={'record_id': 'parent_id', 'indicator': 'event_name'}),
+            on='parent_id', how='inner'
+        )
+        links['indicator_name'] = links['related_indicator'].map(
+            self._map_indicator_code_to_name)
+        links = links[links['indicator_name'].isin(indicators_list)]
+
+        # Quantify all impacts column-wise
+        links = links.assign(impact_value=self._quantify_impact_columns(links))
+
+        # aggfunc='last' keeps the overwrite-on-duplicate behavior of the
+        # old row loop; reindex restores the full grid with zeros
+        matrix = links.pivot_table(index='event_name', columns='indicator_name',
+                                   values='impact_value', aggfunc='last') \
+            .reindex(index=events_list, columns=indicators_list).fillna(0.0)
+        matrix.index.name = None
+        matrix.columns.name = None
+
         self.association_matrix = matrix
         return matrix
     
     def _map_indicator_code_to_name(self, indicator_code: str) -> str:
         """Map indicator codes to full names"""
-        mapping = {
-            'ACC_OWNERSHIP': 'Account Ownership Rate',
-            'ACC_MM_ACCOUNT': 'Mobile Money Account Rate',
-            'USG_DIGITAL_PAYMENT': 'USG_DIGITAL_PAYMENT'
-        }
-        return mapping.get(indicator_code, indicator_code)
+        return self._CODE_TO_NAME.get(indicator_code, indicator_code)
     
+    def _quantify_impact_columns(self, links: pd.DataFrame) -> np.ndarray:
+        """
+        Column-wise counterpart of _quantify_impact
+
+        Args:
+            links: Impact links with impact_direction, impact_magnitude,
+                   and impact_estimate columns
+
+        Returns:
+            Signed impact value per link row
+        """
+        magnitude_values = links['impact_magnitude'].map(
+            {'high': 15.0, 'medium': 8.0, 'low': 3.0}).fillna(5.0)
+        base = links['impact_estimate'].where(
+            links['impact_estimate'].notna(), magnitude_values)
+        sign = np.where(links['impact_direction'].eq('increase'), 1.0, -1.0)
+        return base.to_numpy() * sign
+
     def _quantify_impact(self, direction: str, magnitude: str, estimate: float) -> float:
         """
         Convert qualitative impact to quantitative estimate
@@ -123,63 +232,90 @@ class EventImpactModeler:
         Returns:
             Time series of effect values
         """
-        event = self.events[self.events['indicator'] == event_name].iloc[0]
+        # The cumulative-impact plot requests the same triples repeatedly
+        key = (event_name, indicator, effect_type)
+        if key not in self._effect_cache:
+            self._effect_cache[key] = self._model_event_effect(event_name, indicator, effect_type)
+        return self._effect_cache[key]
+
+    def _model_event_effect(self, event_name: str, indicator: str,
+                            effect_type: str) -> pd.Series:
+        """Build the effect series for one (event, indicator, type) triple"""
+        event = self._event_by_name.loc[event_name]
         event_date = event['event_date']
         
         # Get impact magnitude from association matrix
         impact = self.association_matrix.loc[event_name, indicator]
         lag_months = self._get_lag_months(event_name, indicator)
         
-        # Create time series
-        dates = pd.date_range(start='2011-01-01', end='2027-12-31', freq='M')
-        effect = pd.Series(0.0, index=dates)
-        
         if effect_type == 'step':
-            # Step function: effect starts after lag period
+            # Step function: effect starts after lag period — one
+            # searchsorted on the shared timeline buffer and a slice
+            # assignment instead of a boolean index scan
             effect_date = event_date + pd.DateOffset(months=lag_months)
-            effect[effect.index >= effect_date] = impact
-            
+            values = np.zeros(len(self._timeline_values))
+            values[self._timeline_values.searchsorted(effect_date.to_datetime64()):] = impact
+            effect = pd.Series(values, index=self._timeline_index)
+
         elif effect_type == 'gradual':
-            # Gradual effect over 12 months
+            # Gradual effect over 12 months, scaled from the cached unit shape
+            effect = pd.Series(
+                impact * self._gradual_shape(event_date, lag_months),
+                index=self._timeline_index)
+
+        else:
+            effect = pd.Series(0.0, index=self._timeline_index)
+
+        return effect
+
+    def _gradual_shape(self, event_date, lag_months: int) -> np.ndarray:
+        """
+        Unit gradual-effect shape for an event: a 12-month 0-to-1 ramp
+        starting after the lag, then a plateau at 1. Cached per
+        (event date, lag) so repeated event/indicator pairs share one
+        array.
+        """
+        key = (event_date, lag_months)
+        shape = self._shape_cache.get(key)
+        if shape is None:
             start_date = event_date + pd.DateOffset(months=lag_months)
             end_date = start_date + pd.DateOffset(months=12)
-            
-            mask = (effect.index >= start_date) & (effect.index <= end_date)
-            months_in_period = len(effect[mask])
-            
+
+            idx = self._timeline_index
+            start_pos = idx.searchsorted(start_date)
+            end_pos = idx.searchsorted(end_date, side='right')
+            months_in_period = end_pos - start_pos
+
             if months_in_period > 0:
-                monthly_increment = impact / months_in_period
-                for i, (date, _) in enumerate(effect[mask].items()):
-                    effect[date] = monthly_increment * (i + 1)
-                effect[effect.index > end_date] = impact
-        
-        return effect
+                if shape_gradual is not None:
+                    # Compiled kernel when numba is installed — one fused
+                    # loop, cached to disk after the first call
+                    shape = shape_gradual(len(idx), int(start_pos), int(end_pos))
+                else:
+                    shape = np.zeros(len(idx))
+                    shape[start_pos:end_pos] = np.arange(1, months_in_period + 1) / months_in_period
+                    shape[end_pos:] = 1.0
+            else:
+                shape = np.zeros(len(idx))
+            self._shape_cache[key] = shape
+        return shape
     
     def _get_lag_months(self, event_name: str, indicator: str) -> int:
         """Get lag period for event-indicator relationship"""
-        # Map indicator name to code
-        reverse_mapping = {
-            'Account Ownership Rate': 'ACC_OWNERSHIP',
-            'Mobile Money Account Rate': 'ACC_MM_ACCOUNT',
-            'USG_DIGITAL_PAYMENT': 'USG_DIGITAL_PAYMENT'
-        }
-        
-        indicator_code = reverse_mapping.get(indicator)
+        indicator_code = self._NAME_TO_CODE.get(indicator)
         if not indicator_code:
             return 12  # Default lag
         
-        # Find matching impact link
-        event_id = self.events[self.events['indicator'] == event_name]['record_id'].values
-        if len(event_id) > 0:
-            event_id = event_id[0]
-            link = self.impact_links[
-                (self.impact_links['parent_id'] == event_id) & 
-                (self.impact_links['related_indicator'] == indicator_code)
-            ]
-            if not link.empty and pd.notna(link['lag_months'].iloc[0]):
-                return int(link['lag_months'].iloc[0])
-        
-        return 12  # Default lag
+        # Indexed lookup instead of two boolean scans per call
+        try:
+            event_id = self._event_by_name.loc[event_name, 'record_id']
+            lag = self._link_by_event_indicator.loc[(event_id, indicator_code), 'lag_months']
+        except KeyError:
+            return 12  # Default lag
+
+        if isinstance(lag, pd.Series):
+            lag = lag.iloc[0]
+        return int(lag) if pd.notna(lag) else 12
     
     def validate_historical_impacts(self) -> pd.DataFrame:
         """
@@ -188,68 +324,82 @@ class EventImpactModeler:
         Returns:
             DataFrame with validation results
         """
-        validation_results = []
-        
+        if self._validation_cache is not None:
+            return self._validation_cache
+
         # Focus on major events with historical data
         key_events = ['Telebirr Launch', 'M-Pesa Ethiopia Launch']
-        
-        for event in key_events:
-            for indicator in ['Account Ownership Rate', 'Mobile Money Account Rate']:
-                # Get actual pre/post values
-                actual_change = self._calculate_actual_change(event, indicator)
-                
-                # Get predicted impact
-                predicted_impact = self.association_matrix.loc[event, indicator]
-                
-                # Calculate error
-                if actual_change is not None:
-                    error = abs(predicted_impact - actual_change)
-                    error_pct = (error / abs(actual_change)) * 100 if actual_change != 0 else None
-                    
-                    validation_results.append({
-                        'event': event,
-                        'indicator': indicator,
-                        'actual_change': actual_change,
-                        'predicted_impact': predicted_impact,
-                        'error': error,
-                        'error_pct': error_pct,
-                        'validation': 'PASS' if error_pct and error_pct < 50 else 'FAIL'
-                    })
-        
-        return pd.DataFrame(validation_results)
+        key_indicators = ['Account Ownership Rate', 'Mobile Money Account Rate']
+
+        # Build every (event, indicator) pair up front, then compute the
+        # comparison columns in whole-array operations instead of per-pair
+        # dict appends
+        pairs = pd.MultiIndex.from_product([key_events, key_indicators],
+                                           names=['event', 'indicator'])
+        results = pairs.to_frame(index=False)
+        results['actual_change'] = [self._calculate_actual_change(event, indicator)
+                                    for event, indicator in pairs]
+        results = results.dropna(subset=['actual_change']).reset_index(drop=True)
+        if results.empty:
+            self._validation_cache = results
+            return results
+
+        predicted = self.association_matrix.stack()
+        results['predicted_impact'] = predicted.reindex(
+            pd.MultiIndex.from_frame(results[['event', 'indicator']])).to_numpy()
+
+        actual = results['actual_change'].to_numpy(dtype=float)
+        results['error'] = np.abs(results['predicted_impact'].to_numpy() - actual)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            error_pct = np.where(actual != 0,
+                                 results['error'].to_numpy() / np.abs(actual) * 100,
+                                 np.nan)
+        results['error_pct'] = error_pct
+        results['validation'] = np.where((error_pct != 0) & (error_pct < 50),
+                                         'PASS', 'FAIL')
+
+        self._validation_cache = results
+        return results
     
     def _calculate_actual_change(self, event: str, indicator: str) -> Optional[float]:
         """Calculate actual change in indicator around event"""
-        event_row = self.events[self.events['indicator'] == event].iloc[0]
-        event_date = event_row['event_date']
-        event_year = event_date.year
-        
-        # Get indicator data
-        indicator_data = self.observations[self.observations['indicator'] == indicator].copy()
-        
-        if len(indicator_data) < 2:
+        event_row = self._event_by_name.loc[event]
+        event_year = event_row['event_date'].year
+
+        # Yearly means were pre-aggregated in prepare_data; locate the
+        # adjacent years with searchsorted on the sorted year index
+        try:
+            yearly = self._yearly_means.loc[indicator]
+        except KeyError:
             return None
-        
-        # Find closest years before and after event
-        indicator_data['year'] = indicator_data['obs_date'].dt.year
-        years = indicator_data['year'].unique()
-        
-        pre_years = [y for y in years if y < event_year]
-        post_years = [y for y in years if y > event_year]
-        
-        if not pre_years or not post_years:
+
+        if len(yearly) < 2:
             return None
-        
-        pre_year = max(pre_years)
-        post_year = min(post_years)
-        
-        pre_value = indicator_data[indicator_data['year'] == pre_year]['value_numeric'].mean()
-        post_value = indicator_data[indicator_data['year'] == post_year]['value_numeric'].mean()
-        
-        return post_value - pre_value
+
+        years = yearly.index.to_numpy()
+        pos_pre = np.searchsorted(years, event_year)                 # first >= event year
+        pos_post = np.searchsorted(years, event_year, side='right')  # first > event year
+
+        if pos_pre == 0 or pos_post == len(years):
+            return None
+
+        values = yearly.to_numpy()
+        return values[pos_post] - values[pos_pre - 1]
     
-    def visualize_impacts(self, save_path: str = None) -> None:
-        """Create visualization of event impacts"""
+    def visualize_impacts(self, save_path: str = None, show: bool = True) -> None:
+        """
+        Create visualization of event impacts
+
+        Args:
+            save_path: Optional path to save the figure to
+            show: Whether to open the interactive window; pass False for
+                headless/batch runs so nothing blocks on the GUI loop
+        """
+        # Plotting deps are only needed here, so import lazily — headless
+        # users of the modeler never pay the matplotlib/seaborn import
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
         fig, axes = plt.subplots(2, 2, figsize=(15, 10))
         
         # 1. Association matrix heatmap
@@ -276,55 +426,72 @@ class EventImpactModeler:
         
         if save_path:
             plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.show()
+        if show:
+            plt.show()
+        else:
+            plt.close(fig)
     
     def _plot_event_timeline(self, ax):
         """Plot event timeline with impact magnitudes"""
-        event_dates = []
-        event_names = []
-        impacts = []
-        
-        for event_name in self.association_matrix.index:
-            event_row = self.events[self.events['indicator'] == event_name].iloc[0]
-            total_impact = self.association_matrix.loc[event_name].sum()
-            
-            event_dates.append(event_row['event_date'])
-            event_names.append(event_name)
-            impacts.append(total_impact)
-        
-        # Sort by date
-        sorted_idx = np.argsort(event_dates)
-        event_dates = [event_dates[i] for i in sorted_idx]
-        event_names = [event_names[i] for i in sorted_idx]
-        impacts = [impacts[i] for i in sorted_idx]
-        
-        # Plot
-        colors = ['green' if imp > 0 else 'red' for imp in impacts]
-        ax.bar(range(len(event_dates)), impacts, color=colors)
-        ax.set_xticks(range(len(event_dates)))
-        ax.set_xticklabels([d.strftime('%Y-%m') for d in event_dates], rotation=45)
+        # One vectorized join of total impacts against event dates
+        # replaces the per-event matrix/frame lookups
+        timeline = (self.association_matrix.sum(axis=1).rename('impact').to_frame()
+                    .join(self._event_by_name[['event_date']], how='left')
+                    .sort_values('event_date'))
+
+        impacts = timeline['impact'].to_numpy()
+        colors = np.where(impacts > 0, 'green', 'red')
+        ax.bar(range(len(timeline)), impacts, color=colors)
+        ax.set_xticks(range(len(timeline)))
+        ax.set_xticklabels(timeline['event_date'].dt.strftime('%Y-%m'), rotation=45)
         ax.set_ylabel('Total Impact (pp)')
         ax.set_title('Event Timeline with Total Impacts')
         ax.axhline(y=0, color='black', linestyle='-', linewidth=0.5)
     
     def _plot_cumulative_impact(self, ax):
         """Plot cumulative impact over time"""
-        dates = pd.date_range(start='2011-01-01', end='2027-12-31', freq='M')
-        cumulative_impact = pd.Series(0.0, index=dates)
-        
-        for event_name in self.association_matrix.index:
-            for indicator in self.association_matrix.columns:
-                effect = self.model_event_effect(event_name, indicator, 'gradual')
-                # Align indices
-                effect = effect.reindex(dates).fillna(0)
-                cumulative_impact += effect
-        
+        # Each curve factors as impact × unit shape, so accumulate
+        # shape-weighted impacts into one ndarray instead of building an
+        # effect Series per (event, indicator) pair
+        cumulative = np.zeros(len(self._timeline_index))
+
+        indicators = self.association_matrix.columns
+        for event_name, *impacts in self.association_matrix.itertuples(name=None):
+            for indicator, impact in zip(indicators, impacts):
+                self._accumulate_event_effect(cumulative, event_name,
+                                              indicator, impact)
+
+        cumulative_impact = pd.Series(cumulative, index=self._timeline_index)
+
         ax.plot(cumulative_impact.index, cumulative_impact.values, linewidth=2)
         ax.set_xlabel('Year')
         ax.set_ylabel('Cumulative Impact (pp)')
         ax.set_title('Cumulative Impact of All Events')
         ax.grid(True, alpha=0.3)
     
+    def _accumulate_event_effect(self, out: np.ndarray, event_name: str,
+                                 indicator: str, impact: float,
+                                 effect_type: str = 'gradual') -> None:
+        """
+        Add one event/indicator effect into a shared timeline buffer
+
+        Mutates out in place — no per-pair Series is materialized. Zero
+        impacts return immediately.
+        """
+        if impact == 0:
+            return
+        event_date = self._event_by_name.loc[event_name, 'event_date']
+        lag_months = self._get_lag_months(event_name, indicator)
+
+        if effect_type == 'step':
+            # A step is constant beyond its start, so a slice add is all
+            # that's needed
+            effect_date = event_date + pd.DateOffset(months=lag_months)
+            pos = self._timeline_values.searchsorted(effect_date.to_datetime64())
+            out[pos:] += impact
+        else:
+            out += impact * self._gradual_shape(event_date, lag_months)
+
     def _plot_validation_results(self, ax):
         """Plot validation results"""
         validation_df = self.validate_historical_impacts()
@@ -343,8 +510,10 @@ class EventImpactModeler:
                width, label='Predicted', alpha=0.7)
         
         ax.set_xticks(x)
-        ax.set_xticklabels([f"{row['event'][:10]}...\n{row['indicator'][:10]}..." 
-                           for _, row in validation_df.iterrows()], rotation=45)
+        ax.set_xticklabels([f"{event[:10]}...\n{indicator[:10]}..."
+                            for event, indicator in
+                            validation_df[['event', 'indicator']].itertuples(
+                                index=False, name=None)], rotation=45)
         ax.set_ylabel('Impact (pp)')
         ax.set_title('Validation: Actual vs Predicted Impacts')
         ax.legend()